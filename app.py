@@ -1,15 +1,18 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import aio_pika
+import aiohttp
 import litestar
 import sentry_sdk
 from aio_pika.abc import AbstractRobustConnection
 from aio_pika.pool import Pool
 from asyncpg import Connection
 from litestar import Litestar, Request, Response, get
+from litestar.config.app import AppConfig
 from litestar.exceptions import HTTPException
 from litestar.logging.config import LoggingConfig
 from litestar.middleware import DefineMiddleware
@@ -20,16 +23,28 @@ from litestar.static_files.config import create_static_files_router
 from litestar.status_codes import HTTP_500_INTERNAL_SERVER_ERROR, HTTP_503_SERVICE_UNAVAILABLE
 from litestar_asyncpg import AsyncpgConfig, AsyncpgConnection, AsyncpgPlugin, PoolConfig
 
+from di.lootbox import XpGrantBatcher
+from di.maps import QualityOverrideBatcher
 from middleware.auth import CustomAuthenticationMiddleware
 from routes import route_handlers
+from routes.completions import AUTOVERIFY_WORKERS, autoverify_worker, drain_autoverify_queue
+from routes.maps.base import link_publish_worker
 from utilities.errors import CustomHTTPException
+from utilities.jobs import JobNotifier
 
 DEFAULT_DSN = os.getenv("DEFAULT_DSN")
+DB_POOL_MIN_SIZE = 10
+DB_POOL_MAX_SIZE = 50
 
 RABBITMQ_USER = os.getenv("RABBITMQ_USER")
 RABBITMQ_PASS = os.getenv("RABBITMQ_PASS")
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST")
 
+AUTOVERIFY_QUEUE_SIZE = 1000
+LINK_PUBLISH_QUEUE_SIZE = 1000
+# Workers mostly sit idle waiting up to 90s on a job, so run enough to keep a burst of links moving.
+LINK_PUBLISH_WORKERS = 32
+
 log = logging.getLogger(__name__)
 log.info(f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASS}@{RABBITMQ_HOST}/")
 log.info(f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASS}@{RABBITMQ_HOST}/")
@@ -68,6 +83,111 @@ async def rabbitmq_connection(_app: Litestar) -> AsyncGenerator[None, None]:
     yield
 
 
+@asynccontextmanager
+async def ocr_http_session(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Share a single keep-alive HTTP session for calls to the OCR service."""
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75, enable_cleanup_closed=True),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+    _app.state.ocr_session = session
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def autoverify_workers(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Run a fixed pool of background workers for OCR auto verification.
+
+    Submissions still queued at shutdown are sent to manual verification instead of being dropped.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=AUTOVERIFY_QUEUE_SIZE)
+    _app.state.autoverify_queue = queue
+    workers = [asyncio.create_task(autoverify_worker(queue)) for _ in range(AUTOVERIFY_WORKERS)]
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await drain_autoverify_queue(queue)
+
+
+@asynccontextmanager
+async def job_notifier(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Share a listener for job completion notifications."""
+    notifier = JobNotifier(_app.state)
+    _app.state.job_notifier = notifier
+    try:
+        yield
+    finally:
+        await notifier.close()
+
+
+@asynccontextmanager
+async def link_publish_workers(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Run a fixed pool of background workers that publish linked-map newsfeed events."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=LINK_PUBLISH_QUEUE_SIZE)
+    _app.state.link_publish_queue = queue
+    workers = [asyncio.create_task(link_publish_worker(queue)) for _ in range(LINK_PUBLISH_WORKERS)]
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+@asynccontextmanager
+async def xp_grant_batcher(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Run the background writer that batches XP grants."""
+    batcher = XpGrantBatcher(_app.state)
+    _app.state.xp_batcher = batcher
+    task = asyncio.create_task(batcher.run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@asynccontextmanager
+async def quality_override_batcher(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Run the background writer that coalesces map quality overrides."""
+    batcher = QualityOverrideBatcher(_app.state)
+    _app.state.quality_batcher = batcher
+    task = asyncio.create_task(batcher.run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+class _OuterPoolAsyncpgPlugin(AsyncpgPlugin):
+    """Asyncpg plugin whose pool outlives the application's own lifespan handlers.
+
+    The stock plugin appends its pool lifespan last, so the pool would close before background
+    workers finish draining on shutdown.
+    """
+
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        """Move the pool lifespan to the front so it is entered first and exited last.
+
+        Args:
+            app_config (AppConfig): The application config.
+
+        Returns:
+            AppConfig: The updated config.
+
+        """
+        app_config = super().on_app_init(app_config)
+        app_config.lifespan.insert(0, app_config.lifespan.pop())
+        return app_config
+
+
 def default_exception_handler(_: Request, exc: Exception) -> Response:
     """Handle errors."""
     status_code = getattr(exc, "status_code", HTTP_500_INTERNAL_SERVER_ERROR)
@@ -112,9 +232,15 @@ def create_app(psql_dsn: str | None = None) -> Litestar:
     """
     dsn = psql_dsn or DEFAULT_DSN
     assert dsn
-    asyncpg = AsyncpgPlugin(
+    asyncpg = _OuterPoolAsyncpgPlugin(
         config=AsyncpgConfig(
-            pool_config=PoolConfig(dsn=dsn, init=_async_pg_init),
+            pool_config=PoolConfig(
+                dsn=dsn,
+                init=_async_pg_init,
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=300,
+            ),
             connection_dependency_key="conn",
         ),
     )
@@ -185,7 +311,15 @@ def create_app(psql_dsn: str | None = None) -> Litestar:
             CustomHTTPException: default_exception_handler,
             HTTP_500_INTERNAL_SERVER_ERROR: internal_server_error_handler,
         },
-        lifespan=[rabbitmq_connection],
+        lifespan=[
+            rabbitmq_connection,
+            ocr_http_session,
+            autoverify_workers,
+            job_notifier,
+            link_publish_workers,
+            xp_grant_batcher,
+            quality_override_batcher,
+        ],
         logging_config=logging_config,
         middleware=[auth_middleware],
     )
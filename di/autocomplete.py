@@ -8,9 +8,16 @@ from genjipk_sdk.maps import Mechanics, OverwatchCode, OverwatchMap, PlaytestSta
 from litestar.datastructures import State
 
 from di.base import BaseService
+from utilities.cache import TTLCache
 
 log = logging.getLogger(__name__)
 
+_AUTOCOMPLETE_CACHE_SIZE = 4096
+_AUTOCOMPLETE_CACHE_TTL = 300
+
+_map_code_cache: TTLCache[tuple, OverwatchCode | None] = TTLCache(_AUTOCOMPLETE_CACHE_SIZE, _AUTOCOMPLETE_CACHE_TTL)
+_top_user_cache: TTLCache[tuple, int | None] = TTLCache(_AUTOCOMPLETE_CACHE_SIZE, _AUTOCOMPLETE_CACHE_TTL)
+
 
 class AutocompleteService(BaseService):
     async def get_similar_map_names(self, search: str, limit: int = 5) -> list[OverwatchMap] | None:
@@ -163,13 +170,14 @@ class AutocompleteService(BaseService):
             return None
         return [r["code"] for r in res]
 
-    async def transform_map_codes(
+    async def transform_map_codes(  # noqa: PLR0913, PLR0917
         self,
         search: str,
         archived: bool | None = None,
         hidden: bool | None = None,
         playtesting: PlaytestStatus | None = None,
         use_pool: bool = False,
+        use_cache: bool = False,
     ) -> OverwatchCode | None:
         """Transform a map name into a code.
 
@@ -180,11 +188,16 @@ class AutocompleteService(BaseService):
             hidden (bool | None, optional): Filter by hidden flag, or `None` for no filter.
             playtesting (PlaytestStatus | None, optional): Filter by playtesting status, or `None` for no filter.
             use_pool (bool): Use a pool instead of a route-based connection.
+            use_cache (bool): Serve repeated lookups from a short-lived in-process cache.
 
         Returns:
             OverwatchCode | None: The closest matching map code, or `None` if none found.
 
         """
+        cache_key = (search, archived, hidden, playtesting)
+        if use_cache and cache_key in _map_code_cache:
+            return _map_code_cache.get(cache_key)
+
         query = """
             SELECT code FROM core.maps
             WHERE ($2::bool IS NULL OR archived = $2) AND
@@ -203,9 +216,10 @@ class AutocompleteService(BaseService):
                 res = cast("OverwatchCode", await conn.fetchval(query, search, archived, hidden, playtesting))
         else:
             res = cast("OverwatchCode", await self._conn.fetchval(query, search, archived, hidden, playtesting))
-        if res is None:
-            return None
-        return f'"{res}"'  # type: ignore
+        transformed = None if res is None else f'"{res}"'
+        if use_cache:
+            _map_code_cache.set(cache_key, transformed)  # type: ignore
+        return transformed  # type: ignore
 
     async def get_similar_users(
         self,
@@ -284,6 +298,55 @@ class AutocompleteService(BaseService):
             return None
         return [(r["user_id"], r["name"]) for r in res]
 
+    async def get_top_user_match(
+        self,
+        search: str,
+        ignore_fake_users: bool = False,
+        use_pool: bool = False,
+        use_cache: bool = False,
+    ) -> int | None:
+        """Get the ID of the user whose nickname, global name, or Overwatch username best matches.
+
+        Args:
+            search (str): Input string to compare.
+            ignore_fake_users (bool): Ignore fake users.
+            use_pool (bool): Use a pool instead of a route-based connection.
+            use_cache (bool): Serve repeated lookups from a short-lived in-process cache.
+
+        Returns:
+            int | None: The best matching user ID, or `None` if no users exist.
+
+        """
+        cache_key = (search, ignore_fake_users)
+        if use_cache and cache_key in _top_user_cache:
+            return _top_user_cache.get(cache_key)
+
+        query = """
+        WITH matches AS (
+            SELECT u.id AS user_id, similarity(name, $1) AS sim
+            FROM core.users u
+            CROSS JOIN LATERAL (
+                VALUES (u.nickname), (u.global_name)
+            ) AS name_list(name)
+            WHERE $2 IS FALSE OR id > 10000000000000
+
+            UNION ALL
+
+            SELECT o.user_id, similarity(o.username, $1) AS sim
+            FROM users.overwatch_usernames o
+            WHERE $2 IS FALSE OR user_id > 10000000000000
+        )
+        SELECT user_id FROM matches ORDER BY sim DESC LIMIT 1;
+        """
+        if use_pool:
+            async with self._pool.acquire() as conn:
+                user_id = await conn.fetchval(query, search, ignore_fake_users)
+        else:
+            user_id = await self._conn.fetchval(query, search, ignore_fake_users)
+        if use_cache:
+            _top_user_cache.set(cache_key, user_id)
+        return user_id
+
 
 async def provide_autocomplete_service(conn: Connection, state: State) -> AutocompleteService:
     """Litestar DI provider for AutocompleteService.
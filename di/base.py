@@ -1,3 +1,4 @@
+import logging
 import typing
 import uuid
 from logging import getLogger
@@ -11,6 +12,8 @@ from litestar.datastructures import Headers, State
 
 log = getLogger(__name__)
 
+_MESSAGE_ENCODER = msgspec.json.Encoder()
+
 
 class RabbitMessageBody(msgspec.Struct):
     type: str
@@ -38,7 +41,6 @@ class BaseService:
         self._conn = conn
         self._pool = state.db_pool
         self._state = state
-        self._tasks = set()
 
     async def publish_message(
         self,
@@ -61,46 +63,48 @@ class BaseService:
         """
         if routing_key not in IGNORE_IDEMPOTENCY and not idempotency_key:
             raise ValueError(f"idempotency_key required for routing_key='{routing_key}'")
-        message_body = msgspec.json.encode(data)
+        message_body = _MESSAGE_ENCODER.encode(data)
 
         if headers.get("X-PYTEST-ENABLED") == "1":
             log.debug("Pytest in progress, skipping queue.")
             return JobStatusResponse(uuid4(), "succeeded")
 
         log.info("[→] Preparing to publish RabbitMQ message")
-        log.debug("Routing key: %s", routing_key)
-        log.debug("Headers: %s", headers)
-        log.debug("Payload: %s", message_body.decode("utf-8", errors="ignore"))
-
-        async with self._state.mq_channel_pool.acquire() as channel:
-            try:
-                job_id = uuid.uuid4()
-                if use_pool:
-                    async with self._pool.acquire() as conn:
-                        await conn.execute(
-                            "INSERT INTO public.jobs (id, action) VALUES ($1, $2);",
-                            job_id,
-                            routing_key,
-                        )
-                else:
-                    await self._conn.execute(
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Routing key: %s", routing_key)
+            log.debug("Headers: %s", headers)
+            log.debug("Payload: %s", message_body.decode("utf-8", errors="ignore"))
+
+        job_id = uuid.uuid4()
+        try:
+            if use_pool:
+                async with self._pool.acquire() as conn:
+                    await conn.execute(
                         "INSERT INTO public.jobs (id, action) VALUES ($1, $2);",
                         job_id,
                         routing_key,
                     )
-                message = aio_pika.Message(
-                    message_body,
-                    correlation_id=str(job_id),
-                    message_id=idempotency_key or str(job_id),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                    headers=headers.dict(),  # pyright: ignore[reportArgumentType]
+            else:
+                await self._conn.execute(
+                    "INSERT INTO public.jobs (id, action) VALUES ($1, $2);",
+                    job_id,
+                    routing_key,
                 )
+            message = aio_pika.Message(
+                message_body,
+                correlation_id=str(job_id),
+                message_id=idempotency_key or str(job_id),
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                headers=headers.dict(),  # pyright: ignore[reportArgumentType]
+            )
+            # Only hold a pooled channel for the publish itself, not for the job insert.
+            async with self._state.mq_channel_pool.acquire() as channel:
                 await channel.default_exchange.publish(
                     message,
                     routing_key=routing_key,
                 )
-                log.info("[✓] Published RabbitMQ message to queue '%s'", routing_key)
-                return JobStatusResponse(id=job_id, status="queued")
-            except Exception:
-                log.exception("[!] Failed to publish message to RabbitMQ queue '%s'", routing_key)
-                return JobStatusResponse(job_id, "failed", "", "Failed to send message.")
+            log.info("[✓] Published RabbitMQ message to queue '%s'", routing_key)
+            return JobStatusResponse(id=job_id, status="queued")
+        except Exception:
+            log.exception("[!] Failed to publish message to RabbitMQ queue '%s'", routing_key)
+            return JobStatusResponse(job_id, "failed", "", "Failed to send message.")
@@ -23,13 +23,22 @@ from genjipk_sdk.internal import JobStatusResponse
 from genjipk_sdk.maps import OverwatchCode
 from litestar import Request
 from litestar.datastructures import State
-from litestar.status_codes import HTTP_400_BAD_REQUEST
+from litestar.status_codes import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
 from di.base import BaseService
+from utilities.cache import TTLCache
 from utilities.errors import CustomHTTPException
 
 log = getLogger(__name__)
 
+_leaderboard_cache: TTLCache[tuple[str, int, int], list[CompletionResponse]] = TTLCache(1024, 30)
+_all_completions_cache: TTLCache[tuple[int, int], list[CompletionResponse]] = TTLCache(256, 30)
+
+
+def _invalidate_completion_caches() -> None:
+    _leaderboard_cache.clear()
+    _all_completions_cache.clear()
+
 
 class CompletionsService(BaseService):
     async def get_completions_for_user(
@@ -203,6 +212,9 @@ class CompletionsService(BaseService):
         Returns:
             int: ID of the newly inserted completion record.
 
+        Raises:
+            CustomHTTPException: If the map code does not exist or has been archived.
+
         """
         query = """
         WITH target_map AS (
@@ -211,7 +223,7 @@ class CompletionsService(BaseService):
                 official,
                 (playtesting = 'In Progress') AS in_playtest
             FROM core.maps
-            WHERE code = $1
+            WHERE code = $1 AND archived = FALSE
         ),
         computed AS (
             SELECT
@@ -246,6 +258,10 @@ class CompletionsService(BaseService):
             )
         except asyncpg.exceptions.CheckViolationError as e:
             raise CustomHTTPException(status_code=HTTP_400_BAD_REQUEST, detail=e.message or "")
+        if res is None:
+            raise CustomHTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail="This map code does not exist or has been archived."
+            )
         return res
 
     def build_completion_patch_query(self, patch: CompletionPatchRequest) -> tuple[str, list[Any]]:
@@ -294,6 +310,7 @@ class CompletionsService(BaseService):
         """
         query, args = self.build_completion_patch_query(data)
         await self._conn.execute(query, record_id, *args)
+        _invalidate_completion_caches()
 
     async def check_for_previous_world_record(self, code: OverwatchCode, user_id: int) -> bool:
         """Check if a record submitted by this user has ever received World Record XP.
@@ -513,6 +530,7 @@ class CompletionsService(BaseService):
                 await conn.execute(query, record_id, data.verified, data.verified_by, data.reason)
         else:
             await self._conn.execute(query, record_id, data.verified, data.verified_by, data.reason)
+        _invalidate_completion_caches()
         message_data = VerificationChangedEvent(
             completion_id=record_id,
             verified=data.verified,
@@ -544,6 +562,10 @@ class CompletionsService(BaseService):
             including medal eligibility and user display names.
 
         """
+        cache_key = (code, page_number, page_size)
+        cached = _leaderboard_cache.get(cache_key)
+        if cached is not None:
+            return cached
         query = f"""
         WITH target_map AS (
             SELECT
@@ -702,7 +724,7 @@ class CompletionsService(BaseService):
             offset = (page_number - 1) * page_size
             rows = await self._conn.fetch(query, code, page_size, offset)
         models = msgspec.convert(rows, list[CompletionResponse])
-
+        _leaderboard_cache.set(cache_key, models)
         return models
 
     async def get_world_records_per_user(self, user_id: int) -> list[CompletionResponse]:
@@ -1114,6 +1136,10 @@ class CompletionsService(BaseService):
             page_size (int): The size of the pagination pages.
             page_number (int): The page number.
         """
+        cache_key = (page_size, page_number)
+        cached = _all_completions_cache.get(cache_key)
+        if cached is not None:
+            return cached
         query = """
         WITH latest_per_user_per_map AS (
             SELECT DISTINCT ON (c.user_id, c.map_id)
@@ -1232,7 +1258,9 @@ class CompletionsService(BaseService):
         """
         offset = (page_number - 1) * page_size
         rows = await self._conn.fetch(query, page_size, offset)
-        return msgspec.convert(rows, list[CompletionResponse])
+        models = msgspec.convert(rows, list[CompletionResponse])
+        _all_completions_cache.set(cache_key, models)
+        return models
 
     async def set_quality_vote_for_map_code(self, code: OverwatchCode, user_id: int, quality: int) -> None:
         """Set the quality vote for a map code per user."""
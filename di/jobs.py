@@ -8,6 +8,8 @@ from genjipk_sdk.internal import JobStatusResponse, JobStatusUpdateRequest
 from litestar.datastructures import State
 from litestar.exceptions import HTTPException
 
+from utilities.jobs import JOB_COMPLETE_CHANNEL
+
 from .base import BaseService
 
 
@@ -49,7 +51,15 @@ class InternalJobsService(BaseService):
             ),
         }
         sql_set, params = sets[data.status]
-        await self._conn.execute(f"UPDATE public.jobs SET {sql_set} WHERE id=$1", *params)
+        if data.status == "processing":
+            await self._conn.execute(f"UPDATE public.jobs SET {sql_set} WHERE id=$1", *params)
+            return
+        # Terminal states wake any waiters once the update commits.
+        query = f"""
+            WITH updated AS (UPDATE public.jobs SET {sql_set} WHERE id=$1 RETURNING id)
+            SELECT pg_notify('{JOB_COMPLETE_CHANNEL}', id::text) FROM updated
+        """
+        await self._conn.execute(query, *params)
 
 
 async def provide_internal_jobs_service(conn: Connection, state: State) -> InternalJobsService:
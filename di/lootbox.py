@@ -1,4 +1,6 @@
+import asyncio
 import random
+from logging import getLogger
 
 import msgspec
 from asyncpg import Connection
@@ -15,8 +17,28 @@ from litestar.datastructures import State
 from litestar.datastructures.headers import Headers
 from litestar.exceptions import HTTPException
 
+from utilities.cache import TTLCache
+
 from .base import BaseService
 
+log = getLogger(__name__)
+
+_REWARDS_DECODER = msgspec.json.Decoder(list[RewardTypeResponse])
+
+_rewards_cache: TTLCache[tuple, list[RewardTypeResponse]] = TTLCache(256, 30)
+_keys_cache: TTLCache[LootboxKeyType | None, list[LootboxKeyTypeResponse]] = TTLCache(64, 30)
+_tier_names_cache: TTLCache[str, tuple[dict[int, str], dict[int, str]]] = TTLCache(1, 3600)
+_xp_multiplier_cache: TTLCache[str, float] = TTLCache(1, 30)
+
+
+class UserLootboxDashboardResponse(msgspec.Struct):
+    keys: list[UserLootboxKeyAmountResponse]
+    rewards: list[UserRewardResponse]
+    coins: int
+
+
+_DASHBOARD_DECODER = msgspec.json.Decoder(UserLootboxDashboardResponse)
+
 WEIGHTS = {
     "Legendary": {
         "weight": 3,
@@ -49,6 +71,118 @@ def gacha(amount: int) -> list[str]:
     return pulls
 
 
+class XpGrantBatcher:
+    """Combine concurrent XP grants into a single upsert.
+
+    Grants are queued with `submit` and a background `run` loop flushes them every `interval` seconds,
+    or as soon as `max_batch` grants are waiting. Each caller gets back the previous and new XP amounts
+    it would have seen had its grant been applied on its own, in submission order. If a batch fails,
+    its grants are retried one at a time so only the offending grant raises.
+    """
+
+    _query = """
+        WITH mult AS (
+          SELECT COALESCE((SELECT value FROM lootbox.xp_multiplier LIMIT 1), 1)::numeric AS m
+        ),
+        grants AS (
+          SELECT g.ord, g.user_id, floor(g.amount::numeric * (SELECT m FROM mult))::bigint AS amount
+          FROM unnest($1::bigint[], $2::int[]) WITH ORDINALITY AS g(user_id, amount, ord)
+        ),
+        totals AS (
+          SELECT user_id, sum(amount)::bigint AS total
+          FROM grants
+          GROUP BY user_id
+        ),
+        upsert_result AS (
+          INSERT INTO lootbox.xp (user_id, amount)
+          SELECT user_id, total FROM totals
+          ON CONFLICT (user_id) DO UPDATE
+          SET amount = lootbox.xp.amount + EXCLUDED.amount
+          RETURNING lootbox.xp.user_id, lootbox.xp.amount
+        ),
+        running AS (
+          SELECT
+            g.ord,
+            g.amount,
+            (u.amount - t.total + sum(g.amount) OVER (PARTITION BY g.user_id ORDER BY g.ord))::bigint AS new_amount
+          FROM grants g
+          JOIN totals t ON t.user_id = g.user_id
+          JOIN upsert_result u ON u.user_id = g.user_id
+        )
+        SELECT new_amount - amount AS previous_amount, new_amount
+        FROM running
+        ORDER BY ord;
+    """
+
+    def __init__(self, state: State, *, interval: float = 0.005, max_batch: int = 512) -> None:
+        """Initialize the batcher.
+
+        Args:
+            state (State): Application state; `state.db_pool` is used for each flush.
+            interval (float): Seconds to wait for more grants after the first one arrives.
+            max_batch (int): Maximum number of grants written in one statement.
+
+        """
+        self._state = state
+        self._interval = interval
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[int, int, asyncio.Future[XpGrantResponse]]] = asyncio.Queue()
+
+    async def submit(self, user_id: int, amount: int) -> XpGrantResponse:
+        """Queue an XP grant and wait for it to be written.
+
+        Args:
+            user_id (int): Target user ID.
+            amount (int): XP amount before the multiplier is applied.
+
+        Returns:
+            XpGrantResponse: Previous and new XP amounts for this grant.
+
+        """
+        future: asyncio.Future[XpGrantResponse] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((user_id, amount, future))
+        return await future
+
+    async def run(self) -> None:
+        """Flush queued grants until cancelled.
+
+        When the loop stops, every grant still waiting, whether queued or in the batch being flushed, is
+        failed so its caller does not hang.
+        """
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                await asyncio.sleep(self._interval)
+                while len(batch) < self._max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                await self._flush(batch)
+        finally:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("XP batcher stopped"))
+
+    async def _flush(self, batch: list[tuple[int, int, asyncio.Future[XpGrantResponse]]]) -> None:
+        try:
+            async with self._state.db_pool.acquire() as conn:
+                rows = await conn.fetch(self._query, [b[0] for b in batch], [b[1] for b in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                log.exception("[!] Failed to write XP grant for user %s.", batch[0][0])
+                if not batch[0][2].done():
+                    batch[0][2].set_exception(e)
+                return
+            log.warning("[!] Batch of %s XP grants failed; retrying each grant on its own.", len(batch))
+            for item in batch:
+                await self._flush([item])
+            return
+        for (*_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(msgspec.convert(row, XpGrantResponse))
+
+
 class LootboxService(BaseService):
     async def view_all_rewards(
         self, reward_type: str | None = None, key_type: LootboxKeyType | None = None, rarity: str | None = None
@@ -64,17 +198,21 @@ class LootboxService(BaseService):
             list[RewardTypeResponse]: All rewards matching filters.
 
         """
-        query = """
-            SELECT *
-            FROM lootbox.reward_types
-            WHERE
-                ($1::text IS NULL OR type = $1::text) AND
-                ($2::text IS NULL OR key_type = $2::text) AND
-                ($3::text IS NULL OR rarity = $3::text)
-            ORDER BY key_type, name
-        """
-        rows = await self._conn.fetch(query, reward_type, key_type, rarity)
-        return msgspec.convert(rows, list[RewardTypeResponse])
+
+        async def _load() -> list[RewardTypeResponse]:
+            query = """
+                SELECT COALESCE(json_agg(r ORDER BY r.key_type, r.name), '[]'::json)::text
+                FROM lootbox.reward_types r
+                WHERE
+                    ($1::text IS NULL OR type = $1::text) AND
+                    ($2::text IS NULL OR key_type = $2::text) AND
+                    ($3::text IS NULL OR rarity = $3::text)
+            """
+            async with self._pool.acquire() as conn:
+                body = await conn.fetchval(query, reward_type, key_type, rarity)
+            return _REWARDS_DECODER.decode(body)
+
+        return list(await _rewards_cache.get_or_load((reward_type, key_type, rarity), _load))
 
     async def view_all_keys(self, key_type: LootboxKeyType | None = None) -> list[LootboxKeyTypeResponse]:
         """View all possible key types.
@@ -86,15 +224,20 @@ class LootboxService(BaseService):
             list[LootboxKeyTypeResponse]: All keys matching filter.
 
         """
-        query = """
-            SELECT *
-            FROM lootbox.key_types
-            WHERE
-                ($1::text IS NULL OR name = $1::text)
-            ORDER BY name
-        """
-        rows = await self._conn.fetch(query, key_type)
-        return msgspec.convert(rows, list[LootboxKeyTypeResponse])
+
+        async def _load() -> list[LootboxKeyTypeResponse]:
+            query = """
+                SELECT *
+                FROM lootbox.key_types
+                WHERE
+                    ($1::text IS NULL OR name = $1::text)
+                ORDER BY name
+            """
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(query, key_type)
+            return msgspec.convert(rows, list[LootboxKeyTypeResponse])
+
+        return list(await _keys_cache.get_or_load(key_type, _load))
 
     async def view_user_rewards(
         self,
@@ -189,24 +332,6 @@ class LootboxService(BaseService):
         query = "SELECT count(*) as keys FROM lootbox.user_keys WHERE key_type = $1 AND user_id = $2"
         return await self._conn.fetchval(query, key_type, user_id)
 
-    async def _use_user_key(self, user_id: int, key_type: LootboxKeyType) -> None:
-        """Consume the oldest key of a given type for a user.
-
-        Args:
-            user_id (int): Target user ID.
-            key_type (LootboxKeyType): Key type.
-
-        """
-        query = """
-            DELETE FROM lootbox.user_keys
-            WHERE earned_at = (
-                SELECT MIN(earned_at)
-                FROM lootbox.user_keys
-                WHERE user_id = $1::bigint AND key_type = $2::text
-            ) AND user_id = $1::bigint AND key_type = $2::text;
-        """
-        await self._conn.execute(query, user_id, key_type)
-
     async def get_random_items(
         self,
         request: Request,
@@ -229,44 +354,17 @@ class LootboxService(BaseService):
             list[RewardTypeResponse]: Selected rewards.
 
         Raises:
-            HTTPException: If the user has insufficient keys.
+            HTTPException: If the user has insufficient keys, or a rolled rarity has no reward for `key_type`.
 
         """
-        key_count = await self._get_user_key_count(user_id, key_type)
-        if key_count <= 0 and not request.headers.get("x-test-mode"):
-            raise HTTPException(detail="User does not have enough keys for this action.", status_code=400)
-
-        rarities = gacha(amount)
-        items = []
+        test_mode = bool(request.headers.get("x-test-mode"))
+        rarities = [rarity.lower() for rarity in gacha(amount)]
         query = """
-            WITH selected_rewards AS (
-                SELECT *
-                FROM lootbox.reward_types
-                WHERE
-                    rarity = $1::text AND
-                    key_type = $2::text
-                ORDER BY random()
-                LIMIT 1
-            )
             SELECT
                 sr.*,
-                EXISTS(
-                    SELECT 1
-                    FROM lootbox.user_rewards ur
-                    WHERE ur.user_id = $3::bigint AND
-                        ur.reward_name = sr.name AND
-                        ur.reward_type = sr.type AND
-                        ur.key_type = $2::text
-                ) AS duplicate,
+                d.duplicate,
                 CASE
-                    WHEN EXISTS(
-                        SELECT 1
-                        FROM lootbox.user_rewards ur
-                        WHERE ur.user_id = $3::bigint AND
-                            ur.reward_name = sr.name AND
-                            ur.reward_type = sr.type AND
-                            ur.key_type = $2::text
-                    )
+                    WHEN d.duplicate
                     THEN CASE
                         WHEN sr.rarity = 'common' THEN 100
                         WHEN sr.rarity = 'rare' THEN 250
@@ -276,13 +374,41 @@ class LootboxService(BaseService):
                     END
                 ELSE 0
                 END AS coin_amount
-            FROM selected_rewards sr;
+            FROM unnest($1::text[]) WITH ORDINALITY AS pulls(rarity, ord)
+            LEFT JOIN LATERAL (
+                SELECT *
+                FROM lootbox.reward_types rt
+                WHERE
+                    rt.rarity = pulls.rarity AND
+                    rt.key_type = $2::text
+                ORDER BY random()
+                LIMIT 1
+            ) sr ON TRUE
+            CROSS JOIN LATERAL (
+                SELECT EXISTS(
+                    SELECT 1
+                    FROM lootbox.user_rewards ur
+                    WHERE ur.user_id = $3::bigint AND
+                        ur.reward_name = sr.name AND
+                        ur.reward_type = sr.type AND
+                        ur.key_type = $2::text
+                ) AS duplicate
+            ) d
+            WHERE $4::bool OR EXISTS(
+                SELECT 1 FROM lootbox.user_keys WHERE user_id = $3::bigint AND key_type = $2::text
+            )
+            ORDER BY pulls.ord;
         """
-        for rarity in rarities:
-            reward = await self._conn.fetchrow(query, rarity.lower(), key_type, user_id)
-            items.append(reward)
-
-        return msgspec.convert(items, list[RewardTypeResponse])
+        rows = await self._conn.fetch(query, rarities, key_type, user_id, test_mode)
+        if not rows and not test_mode and await self._get_user_key_count(user_id, key_type) <= 0:
+            raise HTTPException(detail="User does not have enough keys for this action.", status_code=400)
+        missing = [rarity for rarity, row in zip(rarities, rows) if row["name"] is None]
+        if missing:
+            raise HTTPException(
+                detail=f"No {key_type} rewards are available for rarity: {', '.join(sorted(set(missing)))}.",
+                status_code=500,
+            )
+        return msgspec.convert(rows, list[RewardTypeResponse])
 
     async def grant_reward_to_user(
         self,
@@ -307,47 +433,70 @@ class LootboxService(BaseService):
             HTTPException: If the user has insufficient keys.
 
         """
-        key_count = await self._get_user_key_count(user_id, key_type)
-        if key_count <= 0 and not request.headers.get("x-test-mode"):
-            raise HTTPException(detail="User does not have enough keys for this action.", status_code=400)
-
+        test_mode = bool(request.headers.get("x-test-mode"))
+        coin_amount = int(reward_name) if reward_type == "coins" else 0
         query = """
-            SELECT rt.rarity
-            FROM lootbox.user_rewards ur
-            JOIN lootbox.reward_types rt ON ur.reward_name = rt.name
-                AND ur.reward_type = rt.type
-                AND ur.key_type = rt.key_type
-            WHERE ur.user_id = $1::bigint AND
-              ur.reward_type = $2::text AND
-              ur.key_type = $3::text AND
-              ur.reward_name = $4::text
+            WITH consumed AS (
+                DELETE FROM lootbox.user_keys
+                WHERE ctid = (
+                    SELECT ctid
+                    FROM lootbox.user_keys
+                    WHERE user_id = $1::bigint AND key_type = $2::text
+                    ORDER BY earned_at
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                ) AND NOT $5::bool
+                RETURNING 1
+            ),
+            allowed AS (
+                SELECT $5::bool OR EXISTS(SELECT 1 FROM consumed) AS ok
+            ),
+            duplicate AS (
+                SELECT rt.rarity
+                FROM lootbox.user_rewards ur
+                JOIN lootbox.reward_types rt ON ur.reward_name = rt.name
+                    AND ur.reward_type = rt.type
+                    AND ur.key_type = rt.key_type
+                WHERE ur.user_id = $1::bigint AND
+                    ur.reward_type = $3::text AND
+                    ur.key_type = $2::text AND
+                    ur.reward_name = $4::text AND
+                    rt.rarity IS NOT NULL
+                LIMIT 1
+            ),
+            granted_reward AS (
+                INSERT INTO lootbox.user_rewards (user_id, reward_type, key_type, reward_name)
+                SELECT $1, $3, $2, $4
+                WHERE (SELECT ok FROM allowed) AND
+                    $3::text != 'coins' AND
+                    NOT EXISTS(SELECT 1 FROM duplicate)
+                RETURNING 1
+            ),
+            granted_coins AS (
+                INSERT INTO core.users (id, coins)
+                SELECT $1, COALESCE(
+                    (
+                        SELECT CASE rarity
+                            WHEN 'common' THEN 100
+                            WHEN 'rare' THEN 250
+                            WHEN 'epic' THEN 500
+                            WHEN 'legendary' THEN 1000
+                            ELSE 0
+                        END
+                        FROM duplicate
+                    ),
+                    $6::int
+                )
+                WHERE (SELECT ok FROM allowed) AND
+                    ($3::text = 'coins' OR EXISTS(SELECT 1 FROM duplicate))
+                ON CONFLICT (id) DO UPDATE SET coins = users.coins + excluded.coins
+                RETURNING 1
+            )
+            SELECT ok FROM allowed;
         """
-        is_duplicate = await self._conn.fetchval(query, user_id, reward_type, key_type, reward_name)
-        if is_duplicate:
-            reward_type = "coins"
-            coin_convert = {
-                "common": 100,
-                "rare": 250,
-                "epic": 500,
-                "legendary": 1000,
-            }
-            reward_name = str(coin_convert[is_duplicate])
-
-        async with self._conn.transaction():
-            if not request.headers.get("x-test-mode"):
-                await self._use_user_key(user_id, key_type)
-            if reward_type != "coins":
-                query = """
-                    INSERT INTO lootbox.user_rewards (user_id, reward_type, key_type, reward_name)
-                    VALUES ($1, $2, $3, $4)
-                """
-                await self._conn.execute(query, user_id, reward_type, key_type, reward_name)
-            else:
-                query = """
-                    INSERT INTO core.users (id, coins) VALUES ($1, $2)
-                    ON CONFLICT (id) DO UPDATE SET coins = users.coins + excluded.coins
-                """
-                await self._conn.execute(query, user_id, int(reward_name))
+        allowed = await self._conn.fetchval(query, user_id, key_type, reward_type, reward_name, test_mode, coin_amount)
+        if not allowed:
+            raise HTTPException(detail="User does not have enough keys for this action.", status_code=400)
 
     async def grant_key_to_user(self, user_id: int, key_type: LootboxKeyType) -> None:
         """Grant a lootbox key to a user.
@@ -360,6 +509,23 @@ class LootboxService(BaseService):
         query = "INSERT INTO lootbox.user_keys (user_id, key_type) VALUES ($1, $2)"
         await self._conn.execute(query, user_id, key_type)
 
+    async def grant_keys_to_users(self, user_ids: list[int], key_type: LootboxKeyType, count: int = 1) -> None:
+        """Grant lootbox keys to many users at once.
+
+        Args:
+            user_ids (list[int]): Target user IDs.
+            key_type (LootboxKeyType): Key type to grant.
+            count (int): Number of keys granted to each user.
+
+        """
+        query = """
+            INSERT INTO lootbox.user_keys (user_id, key_type)
+            SELECT u.user_id, $2::text
+            FROM unnest($1::bigint[]) AS u(user_id)
+            CROSS JOIN generate_series(1, $3::int);
+        """
+        await self._conn.execute(query, user_ids, key_type, count)
+
     async def grant_active_key_to_user(self, user_id: int) -> None:
         """Grant the currently active lootbox key to a user.
 
@@ -434,10 +600,67 @@ class LootboxService(BaseService):
             return 0
         return amount
 
+    async def get_user_dashboard(self, user_id: int) -> UserLootboxDashboardResponse:
+        """Get a user's keys, rewards, and coin balance in one query.
+
+        Args:
+            user_id (int): Target user ID.
+
+        Returns:
+            UserLootboxDashboardResponse: Key amounts per type, earned rewards, and coin balance.
+
+        """
+        query = """
+            SELECT json_build_object(
+                'keys', COALESCE((
+                    SELECT json_agg(k)
+                    FROM (
+                        SELECT count(*) AS amount, key_type
+                        FROM lootbox.user_keys
+                        WHERE user_id = $1::bigint
+                        GROUP BY key_type
+                    ) k
+                ), '[]'::json),
+                'rewards', COALESCE((
+                    SELECT json_agg(r)
+                    FROM (
+                        SELECT DISTINCT ON (rt.name, rt.key_type, rt.type)
+                            ur.user_id,
+                            ur.earned_at,
+                            rt.name,
+                            rt.type,
+                            NULL as medal,
+                            rt.rarity
+                        FROM lootbox.user_rewards ur
+                        LEFT JOIN lootbox.reward_types rt ON ur.reward_name = rt.name
+                            AND ur.reward_type = rt.type
+                            AND ur.key_type = rt.key_type
+                        WHERE ur.user_id = $1::bigint
+
+                        UNION ALL
+
+                        SELECT
+                            user_id,
+                            now() as earned_at,
+                            map_name as name,
+                            'mastery' as type,
+                            medal,
+                            'common' as rarity
+                        FROM maps.mastery
+                        WHERE user_id = $1::bigint AND medal != 'Placeholder'
+                    ) r
+                ), '[]'::json),
+                'coins', COALESCE((SELECT coins FROM core.users WHERE id = $1::bigint), 0)
+            )::text;
+        """
+        body = await self._conn.fetchval(query, user_id)
+        return _DASHBOARD_DECODER.decode(body)
+
     async def grant_user_xp(self, headers: Headers, user_id: int, data: XpGrantRequest) -> XpGrantResponse:
         """Grant XP to a user.
 
-        Performs an upsert into the XP table, summing new and existing values.
+        The grant is handed to the application's `XpGrantBatcher`, which upserts it into the XP table
+        together with any other grants that arrive at the same time.
 
         Args:
             user_id (int): Target user ID.
@@ -448,28 +671,7 @@ class LootboxService(BaseService):
             XpGrantResult: Previous and new XP amounts.
 
         """
-        query = """
-        WITH mult AS (
-          SELECT COALESCE((SELECT value FROM lootbox.xp_multiplier LIMIT 1), 1)::numeric AS m
-        ),
-        old_values AS (
-          SELECT amount
-          FROM lootbox.xp
-          WHERE user_id = $1
-        ),
-        upsert_result AS (
-          INSERT INTO lootbox.xp (user_id, amount)
-          SELECT $1, floor($2::numeric * (SELECT m FROM mult))::bigint
-          ON CONFLICT (user_id) DO UPDATE
-          SET amount = lootbox.xp.amount + EXCLUDED.amount
-          RETURNING lootbox.xp.amount
-        )
-        SELECT
-          COALESCE((SELECT amount FROM old_values), 0) AS previous_amount,
-          (SELECT amount FROM upsert_result)           AS new_amount;
-        """
-        row = await self._conn.fetchrow(query, user_id, data.amount)
-        result = msgspec.convert(row, XpGrantResponse)
+        result = await self._state.xp_batcher.submit(user_id, data.amount)
         message = XpGrantEvent(
             user_id=user_id,
             amount=data.amount,
@@ -498,48 +700,45 @@ class LootboxService(BaseService):
             TierChange: Tier and prestige change details.
 
         """
-        query = """
-            WITH old_tier AS (
-                SELECT
-                    $1::int AS old_xp,
-                    (($1 / 100) % 100) AS old_normalized_tier,
-                    (($1 / 100) / 100) AS old_prestige_level,
-                    x.name AS old_main_tier_name,
-                    s.name AS old_sub_tier_name
-                FROM lootbox.main_tiers x
-                LEFT JOIN lootbox.sub_tiers s ON (($1 / 100) % 5) = s.threshold
-                WHERE (($1 / 100) % 100) / 5 = x.threshold
-            ),
-            new_tier AS (
-                SELECT
-                    $2::int AS new_xp,
-                    (($2 / 100) % 100) AS new_normalized_tier,
-                    (($2 / 100) / 100) AS new_prestige_level,
-                    x.name AS new_main_tier_name,
-                    s.name AS new_sub_tier_name
-                FROM lootbox.main_tiers x
-                LEFT JOIN lootbox.sub_tiers s ON (($2 / 100) % 5) = s.threshold
-                WHERE (($2 / 100) % 100) / 5 = x.threshold
-            )
-            SELECT
-                o.old_xp,
-                n.new_xp,
-                o.old_main_tier_name,
-                n.new_main_tier_name,
-                o.old_sub_tier_name,
-                n.new_sub_tier_name,
-                old_prestige_level,
-                new_prestige_level,
-                CASE
-                    WHEN o.old_main_tier_name != n.new_main_tier_name THEN 'Main Tier Rank Up'
-                    WHEN o.old_sub_tier_name != n.new_sub_tier_name THEN 'Sub-Tier Rank Up'
-                END AS rank_change_type,
-                o.old_prestige_level != n.new_prestige_level AS prestige_change
-            FROM old_tier o
-            JOIN new_tier n ON TRUE;
+        main_tiers, sub_tiers = await _tier_names_cache.get_or_load("tiers", self._load_tier_names)
+        old_level, new_level = old_xp // 100, new_xp // 100
+        old_main, new_main = main_tiers.get(old_level % 100 // 5), main_tiers.get(new_level % 100 // 5)
+        old_sub, new_sub = sub_tiers.get(old_level % 5), sub_tiers.get(new_level % 5)
+        old_prestige, new_prestige = old_level // 100, new_level // 100
+
+        rank_change_type = None
+        if old_main != new_main:
+            rank_change_type = "Main Tier Rank Up"
+        elif old_sub != new_sub:
+            rank_change_type = "Sub-Tier Rank Up"
+
+        return msgspec.convert(
+            {
+                "old_xp": old_xp,
+                "new_xp": new_xp,
+                "old_main_tier_name": old_main,
+                "new_main_tier_name": new_main,
+                "old_sub_tier_name": old_sub,
+                "new_sub_tier_name": new_sub,
+                "old_prestige_level": old_prestige,
+                "new_prestige_level": new_prestige,
+                "rank_change_type": rank_change_type,
+                "prestige_change": old_prestige != new_prestige,
+            },
+            TierChangeResponse,
+        )
+
+    async def _load_tier_names(self) -> tuple[dict[int, str], dict[int, str]]:
+        """Load the main and sub tier names keyed by their thresholds.
+
+        Returns:
+            tuple[dict[int, str], dict[int, str]]: Main tier names and sub tier names.
+
         """
-        row = await self._conn.fetchrow(query, old_xp, new_xp)
-        return msgspec.convert(row, TierChangeResponse)
+        async with self._pool.acquire() as conn:
+            main_rows = await conn.fetch("SELECT threshold, name FROM lootbox.main_tiers;")
+            sub_rows = await conn.fetch("SELECT threshold, name FROM lootbox.sub_tiers;")
+        return {r["threshold"]: r["name"] for r in main_rows}, {r["threshold"]: r["name"] for r in sub_rows}
 
     async def edit_xp_multiplier(self, multiplier: float) -> None:
         """Edit the XP multiplier.
@@ -549,6 +748,7 @@ class LootboxService(BaseService):
         """
         query = "UPDATE lootbox.xp_multiplier SET value=$1;"
         await self._conn.execute(query, multiplier)
+        _xp_multiplier_cache.pop("multiplier")
 
     async def get_xp_multiplier(self) -> float:
         """Get the XP multiplier that is currently set.
@@ -556,8 +756,11 @@ class LootboxService(BaseService):
         Returns:
             float: The XP multiplier.
         """
-        query = "SELECT * FROM lootbox.xp_multiplier LIMIT 1;"
-        return await self._conn.fetchval(query)
+        return await _xp_multiplier_cache.get_or_load("multiplier", self._load_xp_multiplier)
+
+    async def _load_xp_multiplier(self) -> float:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval("SELECT * FROM lootbox.xp_multiplier LIMIT 1;")
 
 
 async def provide_lootbox_service(conn: Connection, state: State) -> LootboxService:
@@ -1,3 +1,4 @@
+import asyncio
 import datetime as dt
 import functools
 import itertools
@@ -698,6 +699,83 @@ def _handle_exceptions(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable
     return wrapper
 
 
+class QualityOverrideBatcher:
+    """Coalesce bursts of quality overrides into a single update.
+
+    Overrides are queued with `submit` and a background `run` loop flushes them `interval` seconds after
+    the first one arrives. When the same map is overridden more than once in a window, the last value wins.
+    """
+
+    _query = """
+        UPDATE maps.ratings r
+        SET quality = v.quality
+        FROM unnest($1::bigint[], $2::int[]) AS v(map_id, quality)
+        WHERE r.map_id = v.map_id
+    """
+
+    def __init__(self, state: State, *, interval: float = 0.05, max_batch: int = 512) -> None:
+        """Initialize the batcher.
+
+        Args:
+            state (State): Application state; `state.db_pool` is used for each flush.
+            interval (float): Seconds to wait for more overrides after the first one arrives.
+            max_batch (int): Maximum number of overrides written in one statement.
+
+        """
+        self._state = state
+        self._interval = interval
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[int, int, asyncio.Future[None]]] = asyncio.Queue()
+
+    async def submit(self, map_id: int, quality: int) -> None:
+        """Queue a quality override and wait for it to be written.
+
+        Args:
+            map_id (int): Internal map ID.
+            quality (int): New quality value.
+
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((map_id, quality, future))
+        await future
+
+    async def run(self) -> None:
+        """Flush queued overrides until cancelled.
+
+        When the loop stops, every override still waiting, whether queued or in the batch being flushed, is
+        failed so its caller does not hang.
+        """
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                await asyncio.sleep(self._interval)
+                while len(batch) < self._max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                await self._flush(batch)
+        finally:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Quality override batcher stopped"))
+
+    async def _flush(self, batch: list[tuple[int, int, asyncio.Future[None]]]) -> None:
+        latest = {map_id: quality for map_id, quality, _ in batch}
+        try:
+            async with self._state.db_pool.acquire() as conn:
+                await conn.execute(self._query, list(latest), list(latest.values()))
+        except Exception as e:
+            log.exception("[!] Failed to write a batch of %s quality overrides.", len(batch))
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+
 class MapService(BaseService):
     @_handle_exceptions
     async def create_map(
@@ -1006,10 +1084,10 @@ class MapService(BaseService):
             convert_raw_difficulty_to_difficulty_all(row["difficulty"]): row["amount"] for row in rows
         }
 
-        buffer = await build_playtest_plot(data)
+        image = await build_playtest_plot(data)
 
         return Stream(
-            buffer,
+            (image,),
             headers={
                 "content-type": "image/png",
                 "content-disposition": 'attachment; filename="playtest.png"',
@@ -1253,6 +1331,16 @@ class MapService(BaseService):
         data = MapPatchRequest(archived=archive)
         await self._edit_core_map_data(code, data)
 
+    async def _bulk_archival_helper(self, codes: list[OverwatchCode], archive: bool) -> None:
+        """Set the archived status of many maps in one statement.
+
+        Args:
+            codes: Overwatch map codes to update.
+            archive: Whether the maps should be archived (True) or unarchived (False).
+        """
+        query = "UPDATE core.maps SET archived = $2 WHERE code = ANY($1::text[])"
+        await self._conn.execute(query, codes, archive)
+
     async def archive_map(self, code: OverwatchCode) -> None:
         """Archive a map.
 
@@ -1266,13 +1354,12 @@ class MapService(BaseService):
     async def bulk_archive_map(self, codes: list[OverwatchCode]) -> None:
         """Archive multiple maps.
 
-        Iterates over the provided codes and marks each as archived.
+        Marks every provided code as archived in a single update.
 
         Args:
             codes: List of Overwatch map codes to archive.
         """
-        for code in codes:
-            await self._archival_helper(code, True)
+        await self._bulk_archival_helper(codes, True)
 
     async def unarchive_map(self, code: OverwatchCode) -> None:
         """Unarchive a map.
@@ -1287,13 +1374,12 @@ class MapService(BaseService):
     async def bulk_unarchive_map(self, codes: list[OverwatchCode]) -> None:
         """Unarchive multiple maps.
 
-        Iterates over the provided codes and marks each as not archived.
+        Marks every provided code as not archived in a single update.
 
         Args:
             codes: List of Overwatch map codes to unarchive.
         """
-        for code in codes:
-            await self._archival_helper(code, False)
+        await self._bulk_archival_helper(codes, False)
 
     async def get_guides(self, code: OverwatchCode, include_records: bool = False) -> list[GuideFullResponse]:
         """Fetch guides for a map with resolved username list.
@@ -1583,6 +1669,9 @@ class MapService(BaseService):
     async def override_map_quality_votes(self, code: OverwatchCode, data: QualityValueRequest) -> None:
         """Override the map quality votes for a particular map code.
 
+        The write is handed to the application's `QualityOverrideBatcher`, which applies it together with
+        any other overrides that arrive at the same time.
+
         Args:
             code (OverwatchCode): The map to override.
             data (QualityValueDTO): The data for overriding.
@@ -1592,10 +1681,7 @@ class MapService(BaseService):
         if not min_quality <= data.value <= max_quality:
             raise ValueError("Quality must be between 1 and 6 (inclusive).")
         map_id = await self._lookup_id(code)
-        query = """
-            UPDATE maps.ratings SET quality=$2 WHERE map_id=$1
-        """
-        await self._conn.execute(query, map_id, data.value)
+        await self._state.quality_batcher.submit(map_id, data.value)
 
     async def get_trending_maps(
         self, limit: Literal[1, 3, 5, 10, 15, 20, 25], window_days: int = 14
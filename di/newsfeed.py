@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterator
 
 import msgspec
+from genjipk_sdk.internal import JobStatusResponse
 from genjipk_sdk.newsfeed import NewsfeedDispatchEvent, NewsfeedEvent, PublishNewsfeedJobResponse
 from litestar.datastructures import Headers
+from litestar.response import Stream
 
 from di.base import BaseService
 
@@ -16,6 +19,9 @@ if TYPE_CHECKING:
 
 log = getLogger(__name__)
 
+_PAYLOAD_ENCODER = msgspec.json.Encoder()
+_PUBLISH_CONCURRENCY = 8
+
 
 class NewsfeedService(BaseService):
     async def create_and_publish(
@@ -38,13 +44,13 @@ class NewsfeedService(BaseService):
             int: The newly created newsfeed event ID.
 
         """
-        q = "INSERT INTO newsfeed (timestamp, payload) VALUES ($1, $2::jsonb) RETURNING id;"
-        payload_obj = msgspec.to_builtins(event.payload)
+        q = "INSERT INTO newsfeed (timestamp, payload) VALUES ($1, $2::text::jsonb) RETURNING id;"
+        payload = _PAYLOAD_ENCODER.encode(event.payload).decode()
         if use_pool:
             async with self._pool.acquire() as conn:
-                new_id = await conn.fetchval(q, event.timestamp, payload_obj)
+                new_id = await conn.fetchval(q, event.timestamp, payload)
         else:
-            new_id = await self._conn.fetchval(q, event.timestamp, payload_obj)
+            new_id = await self._conn.fetchval(q, event.timestamp, payload)
         idempotency_key = f"newsfeed:create:{new_id}"
         job_status = await self.publish_message(
             routing_key="api.newsfeed.create",
@@ -55,6 +61,57 @@ class NewsfeedService(BaseService):
         )
         return PublishNewsfeedJobResponse(job_status, new_id)
 
+    async def create_and_publish_many(
+        self,
+        events: list[NewsfeedEvent],
+        *,
+        headers: Headers,
+    ) -> list[PublishNewsfeedJobResponse]:
+        """Insert many newsfeed events in one statement and publish each new ID to Rabbit.
+
+        IDs are drawn per event alongside its ordinal, so each result is paired with its own event. At most
+        `_PUBLISH_CONCURRENCY` publishes run at once.
+
+        Args:
+            events (list[NewsfeedEvent]): The events to persist, in order.
+            headers (Headers): Additional headers to include in the published messages.
+
+        Returns:
+            list[PublishNewsfeedJobResponse]: One publish result per event, in the same order as `events`.
+
+        """
+        if not events:
+            return []
+        q = """
+            WITH e AS MATERIALIZED (
+                SELECT e.ord, e.timestamp, e.payload, nextval(pg_get_serial_sequence('newsfeed', 'id'))::int AS id
+                FROM unnest($1::timestamptz[], $2::text[]) WITH ORDINALITY AS e(timestamp, payload, ord)
+            ),
+            inserted AS (
+                INSERT INTO newsfeed (id, timestamp, payload) OVERRIDING SYSTEM VALUE
+                SELECT id, timestamp, payload::jsonb FROM e
+            )
+            SELECT id FROM e ORDER BY ord;
+        """
+        timestamps = [e.timestamp for e in events]
+        payloads = [_PAYLOAD_ENCODER.encode(e.payload).decode() for e in events]
+        rows = await self._conn.fetch(q, timestamps, payloads)
+        new_ids = [row["id"] for row in rows]
+        semaphore = asyncio.Semaphore(_PUBLISH_CONCURRENCY)
+
+        async def _publish(new_id: int) -> JobStatusResponse:
+            async with semaphore:
+                return await self.publish_message(
+                    routing_key="api.newsfeed.create",
+                    data=NewsfeedDispatchEvent(newsfeed_id=new_id),
+                    headers=headers,
+                    idempotency_key=f"newsfeed:create:{new_id}",
+                    use_pool=True,
+                )
+
+        statuses = await asyncio.gather(*(_publish(new_id) for new_id in new_ids))
+        return [PublishNewsfeedJobResponse(status, new_id) for status, new_id in zip(statuses, new_ids)]
+
     async def get_event(self, id_: int) -> NewsfeedEvent | None:
         """Fetch a single newsfeed event by ID.
 
@@ -106,6 +163,43 @@ class NewsfeedService(BaseService):
         log.debug(rows)
         return msgspec.convert(rows, list[NewsfeedEvent])
 
+    async def stream_events(
+        self,
+        *,
+        limit: int,
+        page_number: int,
+        type_: str | None,
+    ) -> Stream:
+        """Stream a page of newsfeed events as newline-delimited JSON.
+
+        Rows are read through a server-side cursor on a pooled connection and encoded one at a time,
+        so the page is never materialized as a list. The connection is held until the body is sent.
+
+        Args:
+            limit (int): Page size to return (e.g., 10, 20, 25, 50).
+            page_number (int): 1-based page number.
+            type_ (str | None): Optional event type filter.
+
+        Returns:
+            Stream: One JSON-encoded `NewsfeedEvent` per line, most recent first.
+
+        """
+        offset = (page_number - 1) * limit
+        q = """
+            SELECT id, timestamp, payload, event_type
+            FROM newsfeed
+            WHERE ($1::text IS NULL OR event_type = $1)
+            ORDER BY timestamp DESC, id DESC
+            LIMIT $2 OFFSET $3
+        """
+
+        async def _iter_ndjson() -> AsyncIterator[bytes]:
+            async with self._pool.acquire() as conn, conn.transaction():
+                async for row in conn.cursor(q, type_, limit, offset, prefetch=limit):
+                    yield _PAYLOAD_ENCODER.encode(msgspec.convert(row, NewsfeedEvent)) + b"\n"
+
+        return Stream(_iter_ndjson(), media_type="application/x-ndjson")
+
 
 async def provide_newsfeed_service(conn: Connection, state: State) -> NewsfeedService:
     """Litestar DI provider for `NewsfeedService`.
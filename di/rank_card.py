@@ -7,6 +7,7 @@ from genjipk_sdk.rank_card import AvatarResponse, BackgroundResponse, RankCardBa
 from genjipk_sdk.users import RankDetailResponse
 from litestar.datastructures import State
 
+from utilities.cache import TTLCache
 from utilities.shared_queries import get_map_mastery_data, get_user_rank_data
 
 from .base import BaseService
@@ -38,6 +39,11 @@ class XPData(NamedTuple):
     community_rank: str
 
 
+_background_cache: TTLCache[int, str] = TTLCache(4096, 300)
+_avatar_cache: TTLCache[int, Avatar] = TTLCache(4096, 300)
+_map_totals_cache: TTLCache[str, list[asyncpg.Record]] = TTLCache(1, 60)
+
+
 class RankCardService(BaseService):
     async def set_background(
         self,
@@ -58,6 +64,7 @@ class RankCardService(BaseService):
             ON CONFLICT (user_id) DO UPDATE SET name = EXCLUDED.name;
         """
         await self._conn.execute(query, user_id, background)
+        _background_cache.pop(user_id)
         return BackgroundResponse(name=background)
 
     async def get_background(self, user_id: int) -> BackgroundResponse:
@@ -87,6 +94,7 @@ class RankCardService(BaseService):
             ON CONFLICT (user_id) DO UPDATE SET skin = EXCLUDED.skin;
         """
         await self._conn.execute(query, user_id, skin)
+        _avatar_cache.pop(user_id)
         return AvatarResponse(skin=skin)
 
     async def get_avatar_skin(self, user_id: int) -> AvatarResponse:
@@ -116,6 +124,7 @@ class RankCardService(BaseService):
             ON CONFLICT (user_id) DO UPDATE SET pose = EXCLUDED.pose;
         """
         await self._conn.execute(query, user_id, pose)
+        _avatar_cache.pop(user_id)
         return AvatarResponse(pose=pose)
 
     async def get_avatar_pose(self, user_id: int) -> AvatarResponse:
@@ -255,11 +264,14 @@ class RankCardService(BaseService):
         Returns:
             Avatar: The user's avatar with skin and pose.
         """
+        avatar = _avatar_cache.get(user_id)
+        if avatar is not None:
+            return avatar
         query = "SELECT skin, pose FROM rank_card.avatar WHERE user_id = $1;"
         row = await self._conn.fetchrow(query, user_id)
-        if row:
-            return Avatar(row["skin"], row["pose"])
-        return Avatar("Overwatch 1", "Heroic")
+        avatar = Avatar(row["skin"], row["pose"]) if row else Avatar("Overwatch 1", "Heroic")
+        _avatar_cache.set(user_id, avatar)
+        return avatar
 
     async def _fetch_nickname(self, user_id: int) -> str:
         """Retrieve the nickname or primary Overwatch username for a user.
@@ -299,7 +311,12 @@ class RankCardService(BaseService):
             GROUP BY base_difficulty
             ORDER BY base_difficulty;
         """
-        return await self._conn.fetch(query)
+
+        async def _load() -> list[asyncpg.Record]:
+            async with self._pool.acquire() as conn:
+                return await conn.fetch(query)
+
+        return await _map_totals_cache.get_or_load("totals", _load)
 
     async def _get_world_record_count(self, user_id: int) -> int:
         """Count how many world records a user currently holds.
@@ -366,8 +383,13 @@ class RankCardService(BaseService):
         Returns:
             str: The name of the chosen background.
         """
+        background = _background_cache.get(user_id)
+        if background is not None:
+            return background
         query = "SELECT name FROM rank_card.background WHERE user_id = $1"
-        return await self._conn.fetchval(query, user_id) or "placeholder"
+        background = await self._conn.fetchval(query, user_id) or "placeholder"
+        _background_cache.set(user_id, background)
+        return background
 
     async def fetch_rank_card_data(self, user_id: int) -> RankCardResponse:
         """Assemble all rank card data for a user.
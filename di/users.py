@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Iterable
 
 import asyncpg
 import msgspec
@@ -135,6 +136,37 @@ class UserService(BaseService):
             coalesced_name=row["coalesced_name"],
         )
 
+    async def get_coalesced_names(self, user_ids: Iterable[int]) -> dict[int, str]:
+        """Return coalesced display names for many users in one query.
+
+        Args:
+            user_ids (Iterable[int]): The IDs of the users.
+
+        Returns:
+            dict[int, str]: Display names keyed by user ID. Unknown IDs are omitted.
+
+        """
+        ids = list(set(user_ids))
+        if not ids:
+            return {}
+        query = """
+        SELECT
+            u.id,
+            COALESCE(
+                (array_remove(array_agg(owu.username ORDER BY owu.is_primary DESC), NULL))[1], -- primary first
+                u.nickname,
+                u.global_name,
+                'Unknown User'
+            ) AS coalesced_name
+        FROM core.users u
+        LEFT JOIN users.overwatch_usernames owu
+            ON u.id = owu.user_id
+        WHERE u.id = ANY($1::bigint[])
+        GROUP BY u.id, u.nickname, u.global_name;
+        """
+        rows = await self._conn.fetch(query, ids)
+        return {row["id"]: row["coalesced_name"] for row in rows}
+
     async def user_exists(self, user_id: int) -> bool:
         """Check if a user exists.
 
@@ -0,0 +1,3 @@
+CREATE INDEX IF NOT EXISTS idx_user_rewards_filter
+    ON lootbox.user_rewards (user_id, key_type, reward_type)
+    INCLUDE (reward_name, earned_at);
@@ -1,11 +1,14 @@
 import asyncio
+import logging
+import math
 import os
+import re
 from logging import getLogger
-from typing import Literal
+from typing import Annotated, Final, Literal
 
 import aiohttp
 import msgspec
-from asyncpg import Connection
+import yarl
 from genjipk_sdk.completions import (
     CompletionCreatedEvent,
     CompletionCreateRequest,
@@ -29,7 +32,8 @@ from genjipk_sdk.maps import OverwatchCode
 from litestar import Controller, Request, get, patch, post, put
 from litestar.datastructures import State
 from litestar.di import Provide
-from litestar.status_codes import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+from litestar.params import Parameter
+from litestar.status_codes import HTTP_400_BAD_REQUEST
 
 from di import (
     AutocompleteService,
@@ -43,12 +47,75 @@ from utilities.errors import CustomHTTPException
 
 log = getLogger(__name__)
 
+_RK_SUBMISSION: Final = "api.completion.submission"
+_RK_AUTOVERIFY_FAILED: Final = "api.completion.autoverification.failed"
+
+_OCR_MAX_CONCURRENCY = 16
+# One auto-verify worker per OCR slot, so the semaphore rather than the pool size bounds OCR calls.
+AUTOVERIFY_WORKERS = _OCR_MAX_CONCURRENCY
+_OCR_MIN_INTERVAL = 0.05
+_OCR_MAX_ATTEMPTS = 3
+_OCR_MAX_BACKOFF = 8.0
+_OCR_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_OCR_TIME_TOLERANCE = 0.005
+_SCREENSHOT_URL_RE = re.compile(r"^https?://\S+$")
+_OCR_DECODER = msgspec.json.Decoder(OcrResponse)
+_OCR_ENCODER = msgspec.json.Encoder()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_OCR_HOST = "genjishimada-ocr" if os.getenv("API_ENVIRONMENT") == "production" else "genjishimada-ocr-dev"
+_OCR_URL = yarl.URL(f"http://{_OCR_HOST}:8000/extract")
+
+
+class _MinIntervalLimiter:
+    """Space out calls so that consecutive acquisitions are at least `interval` seconds apart."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            interval (float): Minimum number of seconds between two acquisitions.
+
+        """
+        self._interval = interval
+        self._last_ts = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the minimum interval since the previous acquisition has elapsed."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._interval - (loop.time() - self._last_ts)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_ts = loop.time()
+
+
+_OCR_SEMAPHORE = asyncio.Semaphore(_OCR_MAX_CONCURRENCY)
+_OCR_LIMITER = _MinIntervalLimiter(_OCR_MIN_INTERVAL)
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Compute how long to wait before retrying an OCR request.
+
+    Args:
+        attempt (int): Zero-based attempt number that just failed.
+        retry_after (str | None): Value of the `Retry-After` response header, if any.
+
+    Returns:
+        float: Seconds to sleep before the next attempt.
+
+    """
+    if retry_after:
+        try:
+            return min(_OCR_MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return min(_OCR_MAX_BACKOFF, 0.25 * 2**attempt)
+
 
 class CompletionsController(Controller):
     """Completions."""
 
-    _tasks = set()
-
     tags = ["Completions"]
     path = "/completions"
     dependencies = {
@@ -69,7 +136,7 @@ class CompletionsController(Controller):
         user_id: int,
         difficulty: DifficultyAll | None = None,
         page_size: Literal[10, 20, 25, 50] = 10,
-        page_number: int = 1,
+        page_number: Annotated[int, Parameter(ge=1, le=10000)] = 1,
     ) -> list[CompletionResponse]:
         """Get completions for a specific user.
 
@@ -113,15 +180,19 @@ class CompletionsController(Controller):
         self,
         svc: CompletionsService,
         request: Request,
+        state: State,
         data: CompletionCreateRequest,
         autocomplete: AutocompleteService,
-        conn: Connection,
     ) -> CompletionSubmissionJobResponse:
         """Submit a new completion.
 
+        Submissions with a screenshot URL and no video are queued for OCR auto verification; everything
+        else goes straight to manual verification.
+
         Args:
             svc (CompletionsService): Service layer for completions.
             request (Request): Request.
+            state (State): Application state.
             data (CompletionCreateDTO): DTO with completion details.
             autocomplete (AutocompleteService): Service for autocomplete.
 
@@ -129,42 +200,20 @@ class CompletionsController(Controller):
             int: ID of the newly inserted completion.
 
         """
-        query = """
-            SELECT EXISTS(SELECT 1 FROM core.maps WHERE code=$1 and archived=FALSE);
-        """
-        if not await conn.fetchval(query, data.code):
-            raise CustomHTTPException(
-                status_code=HTTP_404_NOT_FOUND, detail="This map code does not exist or has been archived."
-            )
-
         completion_id = await svc.submit_completion(data)
-        if not completion_id:
-            raise ValueError("Some how completion ID is null?")
-
-        if not data.video:
-            task = asyncio.create_task(
-                _attempt_auto_verify(
-                    request=request,
-                    svc=svc,
-                    autocomplete=autocomplete,
-                    completion_id=completion_id,
-                    data=data,
-                )
-            )
-            self._tasks.add(task)
-            task.add_done_callback(lambda t: self._tasks.remove(t))
 
-            return CompletionSubmissionJobResponse(None, completion_id)
+        if data.video or not data.screenshot or not _SCREENSHOT_URL_RE.match(data.screenshot):
+            job_status = await _publish_submission(svc, request, data, completion_id)
+            return CompletionSubmissionJobResponse(job_status, completion_id)
 
-        idempotency_key = f"completion:submission:{data.user_id}:{completion_id}"
-        job_status = await svc.publish_message(
-            routing_key="api.completion.submission",
-            data=CompletionCreatedEvent(completion_id),
-            headers=request.headers,
-            idempotency_key=idempotency_key,
-            use_pool=True,
-        )
-        return CompletionSubmissionJobResponse(job_status, completion_id)
+        try:
+            state.autoverify_queue.put_nowait((request, svc, autocomplete, completion_id, data))
+        except asyncio.QueueFull:
+            log.warning("Auto-verify queue is full, sending completion %s to manual verification.", completion_id)
+            job_status = await _publish_submission(svc, request, data, completion_id)
+            return CompletionSubmissionJobResponse(job_status, completion_id)
+
+        return CompletionSubmissionJobResponse(None, completion_id)
 
     @patch(
         path="/{record_id:int}",
@@ -268,7 +317,7 @@ class CompletionsController(Controller):
         svc: CompletionsService,
         code: str,
         page_size: Literal[10, 20, 25, 50, 0] = 10,
-        page_number: int = 1,
+        page_number: Annotated[int, Parameter(ge=1, le=10000)] = 1,
     ) -> list[CompletionResponse]:
         """Get the leaderboard for a map.
 
@@ -360,7 +409,7 @@ class CompletionsController(Controller):
         self,
         svc: CompletionsService,
         page_size: Literal[10, 20, 25, 50] = 10,
-        page_number: int = 1,
+        page_number: Annotated[int, Parameter(ge=1, le=10000)] = 1,
     ) -> list[CompletionResponse]:
         """Get all completions that are verified sorted by most recent.
 
@@ -402,7 +451,7 @@ class CompletionsController(Controller):
         self,
         svc: CompletionsService,
         code: str,
-        page_number: int = 1,
+        page_number: Annotated[int, Parameter(ge=1, le=10000)] = 1,
         page_size: Literal[10, 20, 25, 50] = 10,
     ) -> list[CompletionResponse]:
         """Get the legacy completions for a map code."""
@@ -428,6 +477,68 @@ class CompletionsController(Controller):
         return await svc.get_upvotes_from_message_id(message_id)
 
 
+async def _publish_submission(
+    svc: CompletionsService,
+    request: Request,
+    data: CompletionCreateRequest,
+    completion_id: int,
+) -> JobStatusResponse:
+    """Queue a completion for manual verification.
+
+    Args:
+        svc (CompletionsService): Service layer for completions.
+        request (Request): Request.
+        data (CompletionCreateRequest): The submitted completion.
+        completion_id (int): ID of the newly inserted completion.
+
+    Returns:
+        JobStatusResponse: Status of the published job.
+
+    """
+    idempotency_key = f"completion:submission:{data.user_id}:{completion_id}"
+    return await svc.publish_message(
+        routing_key=_RK_SUBMISSION,
+        data=CompletionCreatedEvent(completion_id),
+        headers=request.headers,
+        idempotency_key=idempotency_key,
+        use_pool=True,
+    )
+
+
+async def _fetch_ocr_data(session: aiohttp.ClientSession, screenshot: str | None) -> OcrResponse:
+    """Extract text from a completion screenshot using the OCR service.
+
+    Transient failures (rate limiting and 5xx responses) are retried with exponential backoff,
+    honoring the `Retry-After` header when present.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session from application state.
+        screenshot (str | None): URL of the screenshot to run OCR against.
+
+    Returns:
+        OcrResponse: The decoded OCR result.
+
+    Raises:
+        aiohttp.ClientResponseError: If the OCR service keeps failing or returns a non-retryable status.
+
+    """
+    body = _OCR_ENCODER.encode({"image_url": screenshot})
+    for attempt in range(_OCR_MAX_ATTEMPTS):
+        try:
+            async with _OCR_SEMAPHORE:
+                await _OCR_LIMITER.acquire()
+                async with session.post(_OCR_URL, data=body, headers=_JSON_HEADERS) as resp:
+                    resp.raise_for_status()
+                    return _OCR_DECODER.decode(await resp.read())
+        except aiohttp.ClientResponseError as e:
+            if e.status not in _OCR_RETRY_STATUSES or attempt == _OCR_MAX_ATTEMPTS - 1:
+                raise
+            delay = _retry_delay(attempt, e.headers.get("Retry-After") if e.headers else None)
+            log.warning("OCR request failed with status %s, retrying in %.2fs", e.status, delay)
+            await asyncio.sleep(delay)
+    raise RuntimeError("OCR retry loop exited without a result.")
+
+
 async def _attempt_auto_verify(
     request: Request,
     svc: CompletionsService,
@@ -435,35 +546,51 @@ async def _attempt_auto_verify(
     completion_id: int,
     data: CompletionCreateRequest,
 ) -> None:
-    hostname = "genjishimada-ocr" if os.getenv("API_ENVIRONMENT") == "production" else "genjishimada-ocr-dev"
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(f"http://{hostname}:8000/extract", json={"image_url": data.screenshot}) as resp,
-    ):
-        resp.raise_for_status()
-        raw_ocr_data = await resp.read()
-        ocr_data = msgspec.json.decode(raw_ocr_data, type=OcrResponse)
+    """Run OCR on a submitted screenshot and auto verify the completion if it matches.
+
+    This runs as a background task after the submission has already been acknowledged, so any failure
+    here must still leave the completion in the manual verification queue.
+
+    Args:
+        request (Request): Request.
+        svc (CompletionsService): Service layer for completions.
+        autocomplete (AutocompleteService): Service for autocomplete.
+        completion_id (int): ID of the newly inserted completion.
+        data (CompletionCreateRequest): The submitted completion.
+
+    """
+    try:
+        ocr_data = await _fetch_ocr_data(request.app.state.ocr_session, data.screenshot)
+    except Exception:
+        log.exception("[!] OCR failed for completion %s, falling back to manual verification.", completion_id)
+        await _publish_submission(svc, request, data, completion_id)
+        return
 
     extracted = ocr_data.extracted
-    extracted_user_cleaned = await autocomplete.get_similar_users(
-        extracted.name or "", use_pool=True, ignore_fake_users=True
+    extracted_user_id, extracted_code_cleaned = await asyncio.gather(
+        autocomplete.get_top_user_match(extracted.name or "", ignore_fake_users=True, use_pool=True, use_cache=True),
+        autocomplete.transform_map_codes(extracted.code or "", use_pool=True, use_cache=True),
     )
-    extracted_code_cleaned = await autocomplete.transform_map_codes(extracted.code or "", use_pool=True)
     if extracted_code_cleaned:
         extracted_code_cleaned = extracted_code_cleaned.replace('"', "")
-        extracted_user_id: int | None = extracted_user_cleaned[0][0] if extracted_user_cleaned else None
 
     # --- Compute condition flags once ---
     code_match = data.code == extracted_code_cleaned
-    time_match = data.time == extracted.time
+    time_match = extracted.time is not None and math.isclose(
+        data.time, extracted.time, rel_tol=0.0, abs_tol=_OCR_TIME_TOLERANCE
+    )
     user_match = extracted_user_id == data.user_id
 
-    log.debug(f"extracted: {extracted}")
-    log.debug(f"data: {data}")
-    log.debug(f"extracted_code_cleaned: {extracted_code_cleaned}")
-    log.debug(f"code_match: {code_match} ({data.code=} vs {extracted_code_cleaned=})")
-    log.debug(f"time_match: {time_match} ({data.time=} vs {extracted.time=})")
-    log.debug(f"user_match: {user_match} ({data.user_id=} vs {extracted_user_id=})")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("extracted: %r", extracted)
+        log.debug("data: %r", data)
+        log.debug(
+            "code_match: %s (data.code=%r vs extracted_code_cleaned=%r)", code_match, data.code, extracted_code_cleaned
+        )
+        log.debug("time_match: %s (data.time=%r vs extracted.time=%r)", time_match, data.time, extracted.time)
+        log.debug(
+            "user_match: %s (data.user_id=%r vs extracted_user_id=%r)", user_match, data.user_id, extracted_user_id
+        )
 
     if code_match and time_match and user_match:
         verification_data = CompletionVerificationUpdateRequest(
@@ -474,31 +601,60 @@ async def _attempt_auto_verify(
         await svc.verify_completion(request, completion_id, verification_data, use_pool=True)
         return
 
-    await svc.publish_message(
-        routing_key="api.completion.autoverification.failed",
-        data=FailedAutoverifyEvent(
-            submitted_code=data.code,
-            submitted_time=data.time,
-            user_id=data.user_id,
-            extracted=extracted,
-            code_match=code_match,
-            time_match=time_match,
-            user_match=user_match,
-            extracted_code_cleaned=extracted_code_cleaned,
-            extracted_time=extracted.time,
-            extracted_user_id=extracted_user_id,
+    await asyncio.gather(
+        svc.publish_message(
+            routing_key=_RK_AUTOVERIFY_FAILED,
+            data=FailedAutoverifyEvent(
+                submitted_code=data.code,
+                submitted_time=data.time,
+                user_id=data.user_id,
+                extracted=extracted,
+                code_match=code_match,
+                time_match=time_match,
+                user_match=user_match,
+                extracted_code_cleaned=extracted_code_cleaned,
+                extracted_time=extracted.time,
+                extracted_user_id=extracted_user_id,
+            ),
+            headers=request.headers,
+            idempotency_key=None,
+            use_pool=True,
         ),
-        headers=request.headers,
-        idempotency_key=None,
-        use_pool=True,
+        _publish_submission(svc, request, data, completion_id),
     )
 
-    idempotency_key = f"completion:submission:{data.user_id}:{completion_id}"
-    await svc.publish_message(
-        routing_key="api.completion.submission",
-        data=CompletionCreatedEvent(completion_id),
-        headers=request.headers,
-        idempotency_key=idempotency_key,
-        use_pool=True,
-    )
-    return
+
+async def autoverify_worker(queue: asyncio.Queue) -> None:
+    """Consume queued submissions and run OCR auto verification on each.
+
+    Several workers share the queue, so submissions are verified concurrently, one per worker.
+
+    Args:
+        queue (asyncio.Queue): Queue of `_attempt_auto_verify` argument tuples.
+
+    """
+    while True:
+        args = await queue.get()
+        try:
+            await _attempt_auto_verify(*args)
+        except Exception:
+            log.exception("[!] Auto verification worker failed.")
+        finally:
+            queue.task_done()
+
+
+async def drain_autoverify_queue(queue: asyncio.Queue) -> None:
+    """Send submissions still queued at shutdown to manual verification.
+
+    Args:
+        queue (asyncio.Queue): Queue of `_attempt_auto_verify` argument tuples.
+
+    """
+    while not queue.empty():
+        request, svc, _autocomplete, completion_id, data = queue.get_nowait()
+        try:
+            await _publish_submission(svc, request, data, completion_id)
+        except Exception:
+            log.exception("[!] Failed to send queued completion %s to manual verification.", completion_id)
+        finally:
+            queue.task_done()
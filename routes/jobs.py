@@ -4,8 +4,16 @@ from asyncpg import Connection
 from genjipk_sdk.internal import ClaimCreateRequest, ClaimResponse, JobStatusResponse, JobStatusUpdateRequest
 from litestar import Controller, delete, get, patch, post
 from litestar.di import Provide
+from msgspec import Struct
 
 from di.jobs import InternalJobsService, provide_internal_jobs_service
+from utilities.cache import TTLCache
+
+_claimed_keys: TTLCache[str, bool] = TTLCache(100_000, 900)
+
+
+class ClaimBatchCreateRequest(Struct):
+    keys: list[str]
 
 
 class InternalJobsController(Controller):
@@ -26,16 +34,48 @@ class InternalJobsController(Controller):
     @post("/idempotency/claim")
     async def claim_idempotency(self, conn: Connection, data: ClaimCreateRequest) -> ClaimResponse:
         """Claim a idempoency key."""
-        tag = await conn.execute(
+        if data.key in _claimed_keys:
+            return ClaimResponse(claimed=False)
+        claimed = await conn.fetchval(
             """
             INSERT INTO public.processed_messages (idempotency_key)
             VALUES ($1)
-            ON CONFLICT DO NOTHING;
+            ON CONFLICT DO NOTHING
+            RETURNING TRUE;
             """,
             data.key,
         )
-        claimed = tag.endswith("INSERT 0 1")
-        return ClaimResponse(claimed=claimed)
+        _claimed_keys.set(data.key, True)
+        return ClaimResponse(claimed=bool(claimed))
+
+    @post("/idempotency/claim-batch")
+    async def claim_idempotency_batch(self, conn: Connection, data: ClaimBatchCreateRequest) -> list[ClaimResponse]:
+        """Claim several idempotency keys in one round-trip.
+
+        Results are returned in the same order as `data.keys`. A key repeated within the batch is only
+        claimed by its first occurrence.
+        """
+        pending = list({key: None for key in data.keys if key not in _claimed_keys})
+        inserted: set[str] = set()
+        if pending:
+            rows = await conn.fetch(
+                """
+                INSERT INTO public.processed_messages (idempotency_key)
+                SELECT unnest($1::text[])
+                ON CONFLICT DO NOTHING
+                RETURNING idempotency_key;
+                """,
+                pending,
+            )
+            inserted = {row["idempotency_key"] for row in rows}
+            for key in pending:
+                _claimed_keys.set(key, True)
+
+        results = []
+        for key in data.keys:
+            results.append(ClaimResponse(claimed=key in inserted))
+            inserted.discard(key)
+        return results
 
     @delete("/idempotency/claim")
     async def delete_claimed_idempotency(self, conn: Connection, data: ClaimCreateRequest) -> None:
@@ -47,3 +87,4 @@ class InternalJobsController(Controller):
             """,
             data.key,
         )
+        _claimed_keys.pop(data.key)
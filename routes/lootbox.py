@@ -1,3 +1,5 @@
+from typing import Annotated
+
 from genjipk_sdk.lootbox import (
     LootboxKeyType,
     LootboxKeyTypeResponse,
@@ -9,8 +11,16 @@ from genjipk_sdk.maps import XPMultiplierRequest
 from genjipk_sdk.xp import TierChangeResponse, XpGrantRequest, XpGrantResponse
 from litestar import Controller, Request, get, patch, post
 from litestar.di import Provide
+from msgspec import Meta, Struct
 
 from di import LootboxService, provide_lootbox_service
+from di.lootbox import UserLootboxDashboardResponse
+
+
+class BulkKeyGrantRequest(Struct):
+    user_ids: Annotated[list[int], Meta(min_length=1, max_length=10_000)]
+    key_type: LootboxKeyType
+    count: Annotated[int, Meta(ge=1, le=100)] = 1
 
 
 class LootboxController(Controller):
@@ -198,6 +208,21 @@ class LootboxController(Controller):
         """
         return await svc.grant_key_to_user(user_id, key_type)
 
+    @post(
+        path="/users/keys/bulk",
+        summary="Grant Keys to Users",
+        description="Grant one or more lootbox keys of a type to many users at once.",
+    )
+    async def grant_keys_to_users(self, svc: LootboxService, data: BulkKeyGrantRequest) -> None:
+        """Grant lootbox keys to many users in a single statement.
+
+        Args:
+            svc (LootboxService): Lootbox service dependency.
+            data (BulkKeyGrantRequest): Target users, key type, and number of keys per user.
+
+        """
+        return await svc.grant_keys_to_users(data.user_ids, data.key_type, data.count)
+
     @post(
         path="/users/{user_id:int}/keys",
         summary="Grant Active Key to User",
@@ -272,6 +297,24 @@ class LootboxController(Controller):
         """
         return await svc.get_user_coins_amount(user_id)
 
+    @get(
+        path="/users/{user_id:int}/dashboard",
+        summary="Get User Lootbox Dashboard",
+        description="Retrieve a user's key amounts, earned rewards, and coin balance in a single response.",
+    )
+    async def get_user_dashboard(self, svc: LootboxService, user_id: int) -> UserLootboxDashboardResponse:
+        """Retrieve a user's keys, rewards, and coin balance together.
+
+        Args:
+            svc (LootboxService): Lootbox service dependency.
+            user_id (int): Target user ID.
+
+        Returns:
+            UserLootboxDashboardResponse: Key amounts, rewards, and coins.
+
+        """
+        return await svc.get_user_dashboard(user_id)
+
     @post(
         path="/users/{user_id:int}/xp",
         summary="Grant XP to User",
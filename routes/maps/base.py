@@ -1,9 +1,10 @@
 import asyncio
 import datetime as dt
+import functools
 import inspect
 import re
 from logging import getLogger
-from typing import Any, Awaitable, Callable, Iterable, Literal
+from typing import Any, Awaitable, Callable, Iterable, Literal, cast
 
 import litestar
 import msgspec
@@ -40,16 +41,19 @@ from genjipk_sdk.newsfeed import (
     NewsfeedBulkArchive,
     NewsfeedBulkUnarchive,
     NewsfeedEvent,
+    NewsfeedEventType,
     NewsfeedFieldChange,
     NewsfeedGuide,
     NewsfeedLegacyRecord,
     NewsfeedLinkedMap,
     NewsfeedMapEdit,
+    NewsfeedPayload,
     NewsfeedUnarchive,
     NewsfeedUnlinkedMap,
 )
 from litestar.datastructures import Headers
 from litestar.di import Provide
+from litestar.enums import MediaType
 from litestar.response import Response, Stream
 from litestar.status_codes import HTTP_200_OK, HTTP_400_BAD_REQUEST
 
@@ -58,7 +62,7 @@ from di.maps import CompletionFilter, MapSearchFilters, MapService, MedalFilter,
 from di.newsfeed import NewsfeedService, provide_newsfeed_service
 from di.users import UserService, provide_user_service
 from utilities.errors import CustomHTTPException
-from utilities.jobs import wait_for_job_completion
+from utilities.jobs import JobNotifier, wait_for_job_completion
 
 log = getLogger(__name__)
 
@@ -70,6 +74,15 @@ _EXCLUDED_FIELDS = {"hidden", "official", "archived", "playtesting"}
 # Fields that are list-like and should be normalized/sorted for comparison
 _LIST_FIELDS = {"creators", "mechanics", "restrictions"}
 
+# Builtin types that msgspec.to_builtins returns unchanged
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+_CODE_RE = re.compile(r"^[A-Z0-9]{4,6}$")
+
+# Pre-encoded JSON bodies for boolean responses
+_TRUE_BODY = b"true"
+_FALSE_BODY = b"false"
+
 
 def _labelize(field: str) -> str:
     """Convert a snake_case field name into a human-friendly label.
@@ -129,16 +142,19 @@ def _list_norm(items: Iterable[Any]) -> list:
 
     Returns:
         A stably sorted list of normalized values.
-
-    Raises:
-        Exception: If element conversion to builtins fails unexpectedly.
     """
     lst = list(items or [])
     try:
-        return sorted((_to_builtin(x) for x in lst), key=lambda x: (str(x)))
+        return sorted(_to_builtin(lst), key=str)
     except Exception:
-        # Ultra-conservative fallback if items are not directly comparable
-        return sorted([str(_to_builtin(x)) for x in lst])
+        # Ultra-conservative fallback if items cannot be converted together or are not directly comparable
+        normalized: list[str] = []
+        for x in lst:
+            try:
+                normalized.append(str(_to_builtin(x)))
+            except Exception:
+                normalized.append(str(x))
+        return sorted(normalized)
 
 
 async def _resolve_creator_name(
@@ -229,13 +245,73 @@ async def _friendly_value(
             f"<a:_:1406300035624341604>: {value.bronze}\n"
         )
 
-    b = _to_builtin(value)
+    b = value if type(value) in _SCALAR_TYPES else _to_builtin(value)
     if b is None:
         return _friendly_none(None)
 
     return str(b)
 
 
+@functools.lru_cache(maxsize=8)
+def _patch_field_names(cls: type[msgspec.Struct]) -> tuple[str, ...]:
+    """Return the field names of a patch struct type, computed once per type.
+
+    Args:
+        cls: The msgspec struct type.
+
+    Returns:
+        The struct's field names in declaration order.
+    """
+    return tuple(f.name for f in msgspec.structs.fields(cls))
+
+
+def _creator_names(creators: Iterable[Any] | None) -> dict[int, str]:
+    """Collect the display names already present on creator values.
+
+    Args:
+        creators: Creator values from a map snapshot or patch (may be ``None``).
+
+    Returns:
+        Names keyed by creator ID, for creators that carry a name.
+    """
+    names: dict[int, str] = {}
+    for x in creators or []:
+        xb = _to_builtin(x)
+        if isinstance(xb, dict) and xb.get("name") and "id" in xb:
+            names[int(xb["id"])] = xb["name"]
+    return names
+
+
+def _unnamed_creator_ids(creators: Iterable[Any] | None) -> set[int]:
+    """Collect the IDs of creators that are missing a display name.
+
+    Args:
+        creators: Creator values from a map snapshot or patch (may be ``None``).
+
+    Returns:
+        The IDs whose names must be resolved before rendering.
+    """
+    ids: set[int] = set()
+    for x in creators or []:
+        xb = _to_builtin(x)
+        if isinstance(xb, dict) and not xb.get("name") and "id" in xb:
+            ids.add(int(xb["id"]))
+    return ids
+
+
+def _make_event(payload: NewsfeedPayload, event_type: NewsfeedEventType) -> NewsfeedEvent:
+    """Build a new, unsaved newsfeed event stamped with the current UTC time.
+
+    Args:
+        payload: The event payload struct.
+        event_type: The newsfeed event type.
+
+    Returns:
+        The event, ready for ``NewsfeedService.create_and_publish``.
+    """
+    return NewsfeedEvent(id=None, timestamp=dt.datetime.now(dt.timezone.utc), payload=payload, event_type=event_type)
+
+
 def _values_equal(field: str, old: Any, new: Any) -> bool:  # noqa: ANN401
     """Check semantic equality of two values for a given field.
 
@@ -252,7 +328,13 @@ def _values_equal(field: str, old: Any, new: Any) -> bool:  # noqa: ANN401
         ``True`` if the values are semantically equal; otherwise ``False``.
     """
     if field in _LIST_FIELDS:
+        if not old or not new:
+            return not old and not new
+        if len(old) != len(new):
+            return False
         return _list_norm(old) == _list_norm(new)
+    if type(old) is type(new) and type(old) in _SCALAR_TYPES:
+        return old == new
     return _to_builtin(old) == _to_builtin(new)
 
 
@@ -267,7 +349,6 @@ class BaseMapsController(litestar.Controller):
         "users": Provide(provide_user_service),
         "jobs": Provide(provide_internal_jobs_service),
     }
-    linked_code_job_statuses = set()
 
     @litestar.get(
         "/",
@@ -462,10 +543,10 @@ class BaseMapsController(litestar.Controller):
         Raises:
             Exception: If publishing fails or value conversion encounters unexpected errors.
         """
-        patch_fields = msgspec.structs.asdict(patch_data)
         changes: list[NewsfeedFieldChange] = []
 
-        for field, new_val in patch_fields.items():
+        for field in _patch_field_names(type(patch_data)):
+            new_val = getattr(patch_data, field)
             if new_val is msgspec.UNSET:
                 continue
             if field in _EXCLUDED_FIELDS:
@@ -478,9 +559,10 @@ class BaseMapsController(litestar.Controller):
 
             old_f = await _friendly_value(field, old_val, get_creator_name=get_creator_name)
             new_f = await _friendly_value(field, new_val, get_creator_name=get_creator_name)
-            label = _labelize(field)
+            if old_f == new_f:
+                continue
 
-            changes.append(NewsfeedFieldChange(field=label, old=old_f, new=new_f))
+            changes.append(NewsfeedFieldChange(field=_labelize(field), old=old_f, new=new_f))
 
         if not changes:
             return
@@ -491,12 +573,7 @@ class BaseMapsController(litestar.Controller):
             reason=reason,
         )
 
-        event = NewsfeedEvent(
-            id=None,
-            timestamp=dt.datetime.now(dt.timezone.utc),
-            payload=payload,
-            event_type="map_edit",
-        )
+        event = _make_event(payload, "map_edit")
 
         await newsfeed.create_and_publish(event, headers=request.headers)
 
@@ -531,11 +608,17 @@ class BaseMapsController(litestar.Controller):
         original_map = await svc.fetch_maps(filters=MapSearchFilters(code=code), single=True)
         patched_map = await svc.patch_map(code, data)
 
-        async def _get_user_coalesced_name(user_id: int) -> str:
-            d = await users.get_user(user_id)
-            if d:
-                return d.coalesced_name or "Unknown User"
-            return "Unknown User"
+        original_creators = getattr(original_map, "creators", None)
+        patched_creators = getattr(data, "creators", None)
+        if patched_creators is msgspec.UNSET:
+            patched_creators = None
+        # Creators kept from the original map already carry names; only fetch the ones that don't.
+        user_names = _creator_names(original_creators)
+        missing_ids = _unnamed_creator_ids(original_creators) | _unnamed_creator_ids(patched_creators)
+        user_names |= await users.get_coalesced_names(missing_ids - user_names.keys())
+
+        def _get_user_coalesced_name(user_id: int) -> str:
+            return user_names.get(user_id) or "Unknown User"
 
         await self._generate_patch_newsfeed(
             newsfeed, original_map, data, "", request, get_creator_name=_get_user_coalesced_name
@@ -565,17 +648,17 @@ class BaseMapsController(litestar.Controller):
             CustomHTTPException: If the code fails the expected format validation.
 
         """
-        if not re.match(r"^[A-Z0-9]{4,6}$", code):
+        if not _CODE_RE.match(code):
             raise CustomHTTPException(
                 detail="Provided code is not valid. Must follow regex ^[A-Z0-9]{4,6}$",
                 status_code=HTTP_400_BAD_REQUEST,
                 extra={"code": code},
             )
 
-        if await conn.fetchval("SELECT EXISTS(SELECT 1 FROM core.maps WHERE code = $1)", code):
-            return Response(content=True, status_code=HTTP_200_OK)
-
-        return Response(content=False, status_code=HTTP_200_OK)
+        exists = await conn.fetchval("SELECT EXISTS(SELECT 1 FROM core.maps WHERE code = $1)", code)
+        return Response(
+            content=_TRUE_BODY if exists else _FALSE_BODY, status_code=HTTP_200_OK, media_type=MediaType.JSON
+        )
 
     @litestar.get(
         "/{code:str}/plot",
@@ -691,9 +774,7 @@ class BaseMapsController(litestar.Controller):
         user_data = await users.get_user(user_id=data.user_id)
         name = user_data.coalesced_name if user_data else None
         event_payload = NewsfeedGuide(code=code, guide_url=data.url, name=name or "Unknown User")
-        event = NewsfeedEvent(
-            id=None, timestamp=dt.datetime.now(dt.timezone.utc), payload=event_payload, event_type="guide"
-        )
+        event = _make_event(event_payload, "guide")
         await newsfeed.create_and_publish(event, headers=request.headers)
         return guide
 
@@ -783,9 +864,7 @@ class BaseMapsController(litestar.Controller):
         """
         affected_count = await svc.convert_map_to_legacy(code)
         event_payload = NewsfeedLegacyRecord(code=code, affected_count=affected_count, reason=reason)
-        event = NewsfeedEvent(
-            id=None, timestamp=dt.datetime.now(dt.timezone.utc), payload=event_payload, event_type="legacy_record"
-        )
+        event = _make_event(event_payload, "legacy_record")
         await newsfeed.create_and_publish(event, headers=request.headers)
 
     @litestar.patch(
@@ -818,7 +897,6 @@ class BaseMapsController(litestar.Controller):
         Side Effects:
             Publishes an ``api.map.archive`` message with the provided payload after a successful update.
         """
-        now = dt.datetime.now(dt.timezone.utc)
         is_single = len(data.codes) == 1
         is_archive = str(data.status).strip().lower() == "archive"
 
@@ -855,12 +933,7 @@ class BaseMapsController(litestar.Controller):
             payload = NewsfeedBulkUnarchive(codes=data.codes, reason="")
             event_type = "bulk_unarchive"
 
-        event = NewsfeedEvent(
-            id=None,
-            timestamp=now,
-            payload=payload,
-            event_type=event_type,
-        )
+        event = _make_event(payload, event_type)
 
         await newsfeed.create_and_publish(event, headers=request.headers)
 
@@ -956,22 +1029,28 @@ class BaseMapsController(litestar.Controller):
             official_code=data.official_code,
             unofficial_code=data.unofficial_code,
         )
-        event = NewsfeedEvent(id=None, timestamp=dt.datetime.now(dt.UTC), payload=payload, event_type="linked_map")
-
-        if in_playtest:
-            assert status
-            task = asyncio.create_task(
-                wait_and_publish_newsfeed(
-                    svc=svc,
-                    jobs=jobs,
-                    newsfeed=newsfeed,
-                    status=status,
-                    event=event,
-                    headers=request.headers,
+        event = _make_event(payload, "linked_map")
+
+        if in_playtest and status is not None:
+            try:
+                request.app.state.link_publish_queue.put_nowait(
+                    {
+                        "svc": svc,
+                        "jobs": jobs,
+                        "newsfeed": newsfeed,
+                        "status": status,
+                        "event": event,
+                        "headers": request.headers,
+                        "notifier": request.app.state.job_notifier,
+                    }
                 )
-            )
-            self.linked_code_job_statuses.add(task)
-            task.add_done_callback(lambda t: self.linked_code_job_statuses.remove(t))
+            except asyncio.QueueFull:
+                log.warning(
+                    "Linked map publish queue is full, publishing %s without waiting for job %s.",
+                    data.official_code,
+                    status.id,
+                )
+                await newsfeed.create_and_publish(event, headers=request.headers)
 
         else:
             await newsfeed.create_and_publish(event, headers=request.headers)
@@ -1000,7 +1079,7 @@ class BaseMapsController(litestar.Controller):
             unofficial_code=data.unofficial_code,
             reason=data.reason,
         )
-        event = NewsfeedEvent(id=None, timestamp=dt.datetime.now(dt.UTC), payload=payload, event_type="unlinked_map")
+        event = _make_event(payload, "unlinked_map")
         await newsfeed.create_and_publish(event, headers=request.headers)
 
 
@@ -1012,6 +1091,7 @@ async def wait_and_publish_newsfeed(  # noqa: PLR0913
     status: JobStatusResponse,
     event: NewsfeedEvent,
     headers: Headers,
+    notifier: JobNotifier | None = None,
 ) -> None:
     """Wait for a job to complete, then publish a newsfeed event.
 
@@ -1022,24 +1102,33 @@ async def wait_and_publish_newsfeed(  # noqa: PLR0913
         status (JobStatus): The initial job status returned from the map service.
         event (NewsfeedEvent): The event to publish once the job finishes.
         headers (Headers): HTTP headers to include when publishing.
+        notifier (JobNotifier | None): Wakes the wait as soon as the job's completion is notified, so
+            polling only runs as a slow fallback.
 
     Returns:
         None
     """
+    wake = await notifier.register(status.id) if notifier else None
     try:
         final_status = await wait_for_job_completion(
             job_id=status.id,
             fetch_status=jobs.get_job_using_pool,  # same signature as before
             timeout=90.0,
+            max_interval=10.0 if wake else 2.0,
+            wake=wake,
         )
 
         if final_status.status == "succeeded":
-            assert isinstance(event.payload, NewsfeedLinkedMap)
+            payload = cast(NewsfeedLinkedMap, event.payload)
             map_data = await svc.fetch_maps(
-                single=True, filters=MapSearchFilters(code=event.payload.official_code), use_pool=True
+                single=True, filters=MapSearchFilters(code=payload.official_code), use_pool=True
             )
-            assert map_data.playtest
-            event.payload.playtest_id = map_data.playtest.thread_id
+            if not map_data.playtest:
+                log.warning(
+                    "Skipping newsfeed publish for job %s: %s has no playtest", final_status.id, payload.official_code
+                )
+                return
+            payload.playtest_id = map_data.playtest.thread_id
             await newsfeed.create_and_publish(event, headers=headers, use_pool=True)
         else:
             log.warning(
@@ -1049,3 +1138,23 @@ async def wait_and_publish_newsfeed(  # noqa: PLR0913
             )
     except Exception:
         log.exception("Error while waiting for job completion for event publish.")
+    finally:
+        if notifier:
+            notifier.unregister(status.id)
+
+
+async def link_publish_worker(queue: asyncio.Queue) -> None:
+    """Consume queued linked-map publishes, waiting on each job before publishing its newsfeed event.
+
+    Args:
+        queue (asyncio.Queue): Queue of `wait_and_publish_newsfeed` keyword argument dicts.
+
+    """
+    while True:
+        kwargs = await queue.get()
+        try:
+            await wait_and_publish_newsfeed(**kwargs)
+        except Exception:
+            log.exception("[!] Linked map publish worker failed.")
+        finally:
+            queue.task_done()
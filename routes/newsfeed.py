@@ -8,6 +8,8 @@ from genjipk_sdk.newsfeed import NewsfeedEvent, NewsfeedEventType, PublishNewsfe
 from litestar import Controller, Request
 from litestar.di import Provide
 from litestar.params import Parameter
+from litestar.response import Stream
+from msgspec import Meta
 
 from di import NewsfeedService, provide_newsfeed_service
 
@@ -46,6 +48,33 @@ class NewsfeedController(Controller):
         """
         return await svc.create_and_publish(data, headers=request.headers)
 
+    @litestar.post(
+        "/batch",
+        summary="Create Newsfeed Events",
+        description=(
+            "Insert up to 100 newsfeed events in a single statement and publish each new ID to RabbitMQ. "
+            "The response lists one publish result per event, in request order."
+        ),
+    )
+    async def create_newsfeed_events(
+        self,
+        request: Request,
+        svc: NewsfeedService,
+        data: Annotated[list[NewsfeedEvent], Meta(min_length=1, max_length=100)],
+    ) -> list[PublishNewsfeedJobResponse]:
+        """Create many newsfeed events and publish their IDs.
+
+        Args:
+            request (Request): Request.
+            svc (NewsfeedService): Injected service instance.
+            data (list[NewsfeedEvent]): Event payloads to persist and publish.
+
+        Returns:
+            list[PublishNewsfeedJobResponse]: Publish results in request order.
+
+        """
+        return await svc.create_and_publish_many(data, headers=request.headers)
+
     @litestar.get(
         "/",
         summary="List Newsfeed Events",
@@ -75,6 +104,35 @@ class NewsfeedController(Controller):
         """
         return await svc.list_events(limit=page_size, page_number=page_number, type_=event_type)
 
+    @litestar.get(
+        "/stream",
+        summary="Stream Newsfeed Events",
+        description=(
+            "Stream a page of newsfeed events as newline-delimited JSON, ordered by most recent first. "
+            'Accepts the same pagination and "type" filter as the list endpoint, without the total count.'
+        ),
+    )
+    async def stream_newsfeed_events(
+        self,
+        svc: NewsfeedService,
+        page_size: Annotated[Literal[10, 20, 25, 50], Parameter()] = 10,
+        page_number: Annotated[int, Parameter(ge=1, le=10000)] = 1,
+        event_type: Annotated[NewsfeedEventType | None, Parameter(query="type")] = None,
+    ) -> Stream:
+        """Stream newsfeed events with pagination and optional type filter.
+
+        Args:
+            svc (NewsfeedService): Injected service instance.
+            page_size (Literal[10, 20, 25, 50]): Number of rows per page.
+            page_number (int): 1-based page number (default 1).
+            event_type (NewsfeedEventType | None): Optional event type filter.
+
+        Returns:
+            Stream: Newline-delimited `NewsfeedEvent` objects ordered by recency.
+
+        """
+        return await svc.stream_events(limit=page_size, page_number=page_number, type_=event_type)
+
     @litestar.get(
         "/{newsfeed_id:int}",
         summary="Get Newsfeed Event",
@@ -0,0 +1,48 @@
+import uuid
+
+import pytest
+from litestar.status_codes import HTTP_201_CREATED
+# ruff: noqa: D102, D103, ANN001, ANN201
+
+
+def _keys(count: int) -> list[str]:
+    return [f"pytest:claim-batch:{uuid.uuid4()}" for _ in range(count)]
+
+
+class TestInternalJobsEndpoints:
+    @pytest.mark.asyncio
+    async def test_claim_batch_preserves_input_order(self, test_client):
+        keys = _keys(3)
+        response = await test_client.post("/api/v3/internal/idempotency/claim-batch", json={"keys": keys})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == [{"claimed": True}, {"claimed": True}, {"claimed": True}]
+
+        response = await test_client.post(
+            "/api/v3/internal/idempotency/claim-batch", json={"keys": [*_keys(1), keys[1], *_keys(1)]}
+        )
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == [{"claimed": True}, {"claimed": False}, {"claimed": True}]
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_repeated_key(self, test_client):
+        a, b = _keys(2)
+        response = await test_client.post("/api/v3/internal/idempotency/claim-batch", json={"keys": [a, b, a, a]})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == [{"claimed": True}, {"claimed": True}, {"claimed": False}, {"claimed": False}]
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_already_claimed(self, test_client, asyncpg_conn):
+        via_endpoint, via_database, fresh = _keys(3)
+        response = await test_client.post("/api/v3/internal/idempotency/claim", json={"key": via_endpoint})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == {"claimed": True}
+        await asyncpg_conn.execute(
+            "INSERT INTO public.processed_messages (idempotency_key) VALUES ($1)",
+            via_database,
+        )
+
+        response = await test_client.post(
+            "/api/v3/internal/idempotency/claim-batch", json={"keys": [via_endpoint, fresh, via_database]}
+        )
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == [{"claimed": False}, {"claimed": True}, {"claimed": False}]
@@ -49,3 +49,55 @@ class TestLootboxEndpoints:
         assert response.status_code == HTTP_200_OK
         data = response.json()
         assert data == 696969
+
+    @pytest.mark.asyncio
+    async def test_grant_keys_to_users_bulk(self, test_client):
+        user_ids = [23, 24]
+        before = {}
+        for user_id in user_ids:
+            response = await test_client.get(f"/api/v3/lootbox/users/{user_id}/keys", params={"key_type": "Winter"})
+            assert response.status_code == HTTP_200_OK
+            before[user_id] = sum(row["amount"] for row in response.json())
+
+        response = await test_client.post(
+            "/api/v3/lootbox/users/keys/bulk",
+            json={"user_ids": user_ids, "key_type": "Winter", "count": 2},
+        )
+        assert response.status_code == HTTP_201_CREATED
+
+        for user_id in user_ids:
+            response = await test_client.get(f"/api/v3/lootbox/users/{user_id}/keys", params={"key_type": "Winter"})
+            assert response.status_code == HTTP_200_OK
+            assert sum(row["amount"] for row in response.json()) == before[user_id] + 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"user_ids": [], "key_type": "Winter"},
+            {"user_ids": [23], "key_type": "Winter", "count": 0},
+            {"user_ids": [23], "key_type": "Winter", "count": 101},
+        ],
+    )
+    async def test_grant_keys_to_users_bulk_invalid(self, test_client, body):
+        response = await test_client.post("/api/v3/lootbox/users/keys/bulk", json=body)
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_get_user_dashboard(self, test_client):
+        response = await test_client.get("/api/v3/lootbox/users/50/dashboard")
+        assert response.status_code == HTTP_200_OK
+        dashboard = response.json()
+
+        keys = (await test_client.get("/api/v3/lootbox/users/50/keys")).json()
+        rewards = (await test_client.get("/api/v3/lootbox/users/50/rewards")).json()
+        coins = (await test_client.get("/api/v3/lootbox/users/50/coins")).json()
+        assert sorted(dashboard["keys"], key=lambda k: k["key_type"]) == sorted(keys, key=lambda k: k["key_type"])
+        assert len(dashboard["rewards"]) == len(rewards)
+        assert dashboard["coins"] == coins
+
+    @pytest.mark.asyncio
+    async def test_get_user_dashboard_unknown_user(self, test_client):
+        response = await test_client.get("/api/v3/lootbox/users/999999999/dashboard")
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {"keys": [], "rewards": [], "coins": 0}
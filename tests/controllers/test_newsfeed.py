@@ -0,0 +1,57 @@
+import json
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+# ruff: noqa: D102, D103, ANN001, ANN201
+
+
+def _legacy_record_event(reason: str) -> dict:
+    return {
+        "id": None,
+        "timestamp": "2025-01-01T00:00:00Z",
+        "payload": {"type": "legacy_record", "code": "1EASY", "affected_count": 1, "reason": reason},
+    }
+
+
+class TestNewsfeedEndpoints:
+    @pytest.mark.asyncio
+    async def test_create_newsfeed_events_batch(self, test_client):
+        reasons = ["batch first", "batch second", "batch third"]
+        response = await test_client.post(
+            "/api/v3/newsfeed/batch",
+            json=[_legacy_record_event(reason) for reason in reasons],
+        )
+        assert response.status_code == HTTP_201_CREATED
+        data = response.json()
+        assert len(data) == len(reasons)
+        assert len({item["newsfeed_id"] for item in data}) == len(reasons)
+        for item, reason in zip(data, reasons):
+            assert item["job_status"]["status"] == "succeeded"
+            response = await test_client.get(f"/api/v3/newsfeed/{item['newsfeed_id']}")
+            assert response.status_code == HTTP_200_OK
+            assert response.json()["payload"]["reason"] == reason
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [0, 101])
+    async def test_create_newsfeed_events_batch_size_bounds(self, test_client, size):
+        response = await test_client.post(
+            "/api/v3/newsfeed/batch",
+            json=[_legacy_record_event("out of bounds") for _ in range(size)],
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_stream_newsfeed_events(self, test_client):
+        response = await test_client.post("/api/v3/newsfeed/batch", json=[_legacy_record_event("streamed")])
+        assert response.status_code == HTTP_201_CREATED
+        response = await test_client.get("/api/v3/newsfeed/stream", params={"type": "legacy_record"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert 0 < len(events) <= 10
+        assert all(event["event_type"] == "legacy_record" for event in events)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params", [{"page_number": 0}, {"page_number": 10001}, {"page_size": 13}])
+    async def test_stream_newsfeed_events_pagination_bounds(self, test_client, params):
+        response = await test_client.get("/api/v3/newsfeed/stream", params=params)
+        assert response.status_code == HTTP_400_BAD_REQUEST
@@ -0,0 +1,87 @@
+import asyncio
+from typing import AsyncIterator
+
+import asyncpg
+import pytest
+from litestar.datastructures import State
+from pytest_databases.docker.postgres import PostgresService
+
+from di.lootbox import XpGrantBatcher
+# ruff: noqa: D102, D103, ANN001, ANN201
+
+
+@pytest.fixture
+async def pool(postgres_service: PostgresService) -> AsyncIterator[asyncpg.Pool]:
+    pool = await asyncpg.create_pool(
+        user=postgres_service.user,
+        password=postgres_service.password,
+        host=postgres_service.host,
+        port=postgres_service.port,
+        database=postgres_service.database,
+    )
+    yield pool
+    await pool.close()
+
+
+@pytest.fixture
+async def batcher(pool) -> AsyncIterator[XpGrantBatcher]:
+    batcher = XpGrantBatcher(State({"db_pool": pool}), interval=0.05)
+    task = asyncio.create_task(batcher.run())
+    yield batcher
+    task.cancel()
+
+
+async def _current_xp(conn: asyncpg.Connection, user_id: int) -> int:
+    return await conn.fetchval("SELECT amount FROM lootbox.xp WHERE user_id = $1", user_id) or 0
+
+
+async def test_repeated_user_ids_in_one_batch(batcher, asyncpg_conn):
+    start_a = await _current_xp(asyncpg_conn, 53)
+    start_b = await _current_xp(asyncpg_conn, 54)
+
+    results = await asyncio.gather(
+        batcher.submit(53, 10),
+        batcher.submit(54, 5),
+        batcher.submit(53, 20),
+        batcher.submit(53, 30),
+    )
+
+    assert [(r.previous_amount, r.new_amount) for r in results] == [
+        (start_a, start_a + 10),
+        (start_b, start_b + 5),
+        (start_a + 10, start_a + 30),
+        (start_a + 30, start_a + 60),
+    ]
+    assert await _current_xp(asyncpg_conn, 53) == start_a + 60
+    assert await _current_xp(asyncpg_conn, 54) == start_b + 5
+
+
+async def test_unknown_user_only_fails_its_own_grant(batcher, asyncpg_conn):
+    start = await _current_xp(asyncpg_conn, 53)
+
+    results = await asyncio.gather(
+        batcher.submit(53, 10),
+        batcher.submit(999999999, 10),
+        batcher.submit(53, 15),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], asyncpg.ForeignKeyViolationError)
+    assert (results[0].previous_amount, results[0].new_amount) == (start, start + 10)
+    assert (results[2].previous_amount, results[2].new_amount) == (start + 10, start + 25)
+    assert await _current_xp(asyncpg_conn, 53) == start + 25
+
+
+async def test_cancelled_batcher_fails_pending_grants(pool):
+    batcher = XpGrantBatcher(State({"db_pool": pool}), interval=10, max_batch=1)
+    task = asyncio.create_task(batcher.run())
+    in_flight = asyncio.create_task(batcher.submit(53, 10))
+    queued = asyncio.create_task(batcher.submit(54, 10))
+    await asyncio.sleep(0.05)
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    for grant in (in_flight, queued):
+        with pytest.raises(RuntimeError, match="XP batcher stopped"):
+            await asyncio.wait_for(grant, timeout=1)
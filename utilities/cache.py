@@ -0,0 +1,120 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A small in-process LRU cache whose entries expire after a fixed time-to-live.
+
+    This is process-local; callers must treat the database as the source of truth and only use
+    it for data where briefly stale reads are acceptable.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries before the least recently used entry is evicted.
+            ttl (float): Seconds an entry stays valid after being set.
+
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including ones that may have expired."""
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        """Return whether `key` has a live entry."""
+        return self._lookup(key) is not None
+
+    def _lookup(self, key: K) -> tuple[float, V] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get a live value from the cache.
+
+        Args:
+            key (K): Cache key.
+            default (V | None): Value returned when the key is missing or expired.
+
+        Returns:
+            V | None: The cached value, or `default`.
+
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            return default
+        return entry[1]
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Get a live value, loading it on a miss.
+
+        Concurrent misses for the same key share a single call to `loader`, so a burst of identical
+        requests results in one load rather than one per request.
+
+        Args:
+            key (K): Cache key.
+            loader (Callable[[], Awaitable[V]]): Coroutine factory that produces the value. It must not
+                depend on request-scoped resources, since its result may be awaited by other requests.
+
+        Returns:
+            V: The cached or freshly loaded value.
+
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry[1]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await loader()
+            self.set(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (K): Cache key.
+            value (V): Value to store.
+
+        """
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove a key from the cache if present.
+
+        Args:
+            key (K): Cache key.
+
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._data.clear()
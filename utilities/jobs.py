@@ -1,24 +1,121 @@
 import asyncio
+import contextlib
 import logging
 import random
-from typing import Awaitable, Callable
+from typing import Any, Awaitable, Callable
 from uuid import UUID
 
 from genjipk_sdk.internal import JobStatusResponse
+from litestar.datastructures import State
 
 log = logging.getLogger(__name__)
 
+JOB_COMPLETE_CHANNEL = "job_complete"
 
-async def wait_for_job_completion(
+
+class JobNotifier:
+    """Wake job waiters as soon as Postgres reports that a job has finished.
+
+    A single pooled connection listens on `JOB_COMPLETE_CHANNEL`, whose payload is the job ID. The
+    connection is acquired on first use, so the notifier can be created before the pool exists.
+    """
+
+    def __init__(self, state: State) -> None:
+        """Initialize the notifier.
+
+        Args:
+            state (State): Application state; `state.db_pool` supplies the listening connection.
+
+        """
+        self._state = state
+        self._conn: Any = None
+        self._lock = asyncio.Lock()
+        self._waiters: dict[UUID, asyncio.Event] = {}
+        self._release_tasks: set[asyncio.Task[None]] = set()
+
+    async def register(self, job_id: UUID) -> asyncio.Event:
+        """Return an event that is set when `job_id` finishes.
+
+        If listening cannot be started the event is still returned; callers keep polling regardless.
+
+        Args:
+            job_id (UUID): The job to watch.
+
+        Returns:
+            asyncio.Event: Event set on the job's completion notification.
+
+        """
+        try:
+            await self._listen()
+        except Exception:
+            log.exception("[!] Could not listen for job completion notifications.")
+        return self._waiters.setdefault(job_id, asyncio.Event())
+
+    def unregister(self, job_id: UUID) -> None:
+        """Stop watching `job_id`.
+
+        Args:
+            job_id (UUID): The job to stop watching.
+
+        """
+        self._waiters.pop(job_id, None)
+
+    async def close(self) -> None:
+        """Stop listening and return the connection to the pool."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        with contextlib.suppress(Exception):
+            await conn.remove_listener(JOB_COMPLETE_CHANNEL, self._on_notify)
+        await self._release(conn)
+
+    async def _release(self, conn: Any) -> None:  # noqa: ANN401
+        with contextlib.suppress(Exception):
+            await self._state.db_pool.release(conn)
+
+    async def _listen(self) -> None:
+        if self._conn is not None:
+            return
+        async with self._lock:
+            if self._conn is not None:
+                return
+            conn = await self._state.db_pool.acquire()
+            await conn.add_listener(JOB_COMPLETE_CHANNEL, self._on_notify)
+            conn.add_termination_listener(self._on_terminate)
+            self._conn = conn
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:  # noqa: ANN401
+        try:
+            job_id = UUID(payload)
+        except ValueError:
+            return
+        event = self._waiters.get(job_id)
+        if event is not None:
+            event.set()
+
+    def _on_terminate(self, conn: Any) -> None:  # noqa: ANN401
+        if self._conn is conn:
+            self._conn = None
+        # The dead connection still holds a pool slot until it is released.
+        task = asyncio.get_running_loop().create_task(self._release(conn))
+        self._release_tasks.add(task)
+        task.add_done_callback(self._release_tasks.discard)
+
+
+async def wait_for_job_completion(  # noqa: PLR0913
     job_id: UUID,
     fetch_status: Callable[[UUID], Awaitable[JobStatusResponse | None]],
     *,
     timeout: float = 60.0,  # noqa: ASYNC109
     base_interval: float = 0.25,
     max_interval: float = 2.0,
+    wake: asyncio.Event | None = None,
 ) -> JobStatusResponse:
     """Poll the database until a JobStatus reaches a terminal state.
 
+    When `wake` is given, each wait between polls ends early as soon as the event is set, so a
+    completion notification is picked up immediately and polling only acts as a fallback.
+
     Args:
         job_id (UUID): The ID of the job to monitor.
         fetch_status (Callable[[UUID], Awaitable[JobStatus | None]]):
@@ -26,6 +123,7 @@ async def wait_for_job_completion(
         timeout (float, optional): Max time in seconds to wait for completion.
         base_interval (float, optional): Initial polling interval.
         max_interval (float, optional): Max interval between polls.
+        wake (asyncio.Event | None, optional): Event that cuts the current wait short, e.g. from `JobNotifier`.
 
     Returns:
         JobStatus: The final job status object when the job finishes.
@@ -50,5 +148,12 @@ async def wait_for_job_completion(
         if asyncio.get_running_loop().time() - start_time >= timeout:
             raise TimeoutError(f"Timed out waiting for job {job_id}")
 
-        await asyncio.sleep(interval * (1.0 + random.random() * 0.2))  # jitter
+        delay = interval * (1.0 + random.random() * 0.2)  # jitter
+        if wake is None:
+            await asyncio.sleep(delay)
+        else:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await wake.wait()
+            wake.clear()
         interval = min(interval * 1.5, max_interval)
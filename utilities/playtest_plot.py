@@ -1,5 +1,4 @@
 import asyncio
-from io import BytesIO
 from typing import Optional, get_args
 
 import kaleido  # noqa: F401
@@ -174,11 +173,14 @@ class DifficultyRadarPlotter:
         return fig
 
 
-async def build_playtest_plot(vote_counts: dict[DifficultyAll, int]) -> BytesIO:
-    """Build a playtest plot."""
+def _render_playtest_plot(vote_counts: dict[DifficultyAll, int]) -> bytes:
     plotter = DifficultyRadarPlotter(vote_counts, min_visible=6)
-    fig = await asyncio.to_thread(plotter.plot_difficulty_radar)
-    buffer = BytesIO()
-    fig.write_image(file=buffer, format="png")
-    buffer.seek(0)
-    return buffer
+    return plotter.plot_difficulty_radar().to_image(format="png")
+
+
+async def build_playtest_plot(vote_counts: dict[DifficultyAll, int]) -> bytes:
+    """Build a playtest plot.
+
+    Both building the figure and the Kaleido PNG export are blocking, so they run together in a worker thread.
+    """
+    return await asyncio.to_thread(_render_playtest_plot, vote_counts)